@@ -1,4 +1,5 @@
-from typing import Annotated
+import time
+from typing import Annotated, Any, Dict, Tuple
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
@@ -7,12 +8,27 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
+from app.core.metrics import timed
 from app.db import models
 from app.db.schemas import TokenPayload
 from app.db.session import get_db
+from app.services.cache import CacheState, TTLCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+# token -> (token expiry, user column snapshot). Per process: other workers may
+# keep serving a deleted user for up to AUTH_CACHE_TTL_SECONDS.
+_user_cache: TTLCache[str, Tuple[int | None, Dict[str, Any]]] = TTLCache(
+    max_entries=settings.auth_cache_max_entries,
+    ttl_seconds=settings.auth_cache_ttl_seconds,
+)
+_SNAPSHOT_COLUMNS = ("id", "email", "full_name", "hashed_password", "is_admin", "created_at")
+
+
+def invalidate_cached_user(email: str) -> None:
+    """Forget every cached token belonging to ``email``"""
+    _user_cache.discard_if(lambda entry: entry[1]["email"] == email)
+
 
 async def get_user_by_email(db: AsyncSession, email: str) -> models.User | None:
     result = await db.execute(select(models.User).where(models.User.email == email))
@@ -23,11 +39,25 @@ async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
     db: Annotated[AsyncSession, Depends(get_db)],
 ) -> models.User:
+    with timed("auth"):
+        return await _authenticate(token, db)
+
+
+async def _authenticate(token: str, db: AsyncSession) -> models.User:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    if settings.auth_cache_enabled:
+        cached, state = _user_cache.lookup(token)
+        if state is CacheState.FRESH:
+            expires_at, snapshot = cached
+            if expires_at is None or time.time() < expires_at:
+                # Detached copy: callers only read columns, never flush it
+                return models.User(**snapshot)
+            _user_cache.invalidate(token)
+
     try:
         payload = jwt.decode(token, settings.secret_key, algorithms=[settings.jwt_algorithm])
         token_data = TokenPayload(**payload)
@@ -39,5 +69,8 @@ async def get_current_user(
     user = result.scalar_one_or_none()
     if user is None:
         raise credentials_exception
+    if settings.auth_cache_enabled:
+        snapshot = {column: getattr(user, column) for column in _SNAPSHOT_COLUMNS}
+        _user_cache.set(token, (token_data.exp, snapshot))
     return user
 
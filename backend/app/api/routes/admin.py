@@ -1,11 +1,21 @@
+from dataclasses import asdict
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.deps import get_current_user, get_db
+from app.api.deps import get_current_user, get_db, invalidate_cached_user
 from app.db import models, schemas
+from app.ml.registry import ModelNotFoundError, active_version, list_versions
+from app.ml.service import activate_version, get_forecast_cache_stats
+from app.services.hot_cities import get_hot_cities_snapshot
+from app.services.weather_client import (
+    get_circuit_snapshot,
+    get_coalesced_request_count,
+    get_rate_limit_snapshot,
+    get_weather_cache_stats,
+)
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -57,3 +67,92 @@ async def delete_user(
     
     await db.delete(user)
     await db.commit()
+    invalidate_cached_user(user.email)
+
+
+@router.get("/cache/weather")
+async def read_weather_cache_stats(current_user: models.User = Depends(check_admin)) -> dict:
+    """
+    Hit/miss/stale counters of the current-weather cache and the number of
+    requests that joined an in-flight upstream call. Only for admins.
+    """
+    stats = get_weather_cache_stats()
+    return {
+        **asdict(stats),
+        "hit_rate": round(stats.hit_rate, 4),
+        "coalesced_requests": get_coalesced_request_count(),
+    }
+
+
+@router.get("/rate-limit")
+async def read_rate_limit(current_user: models.User = Depends(check_admin)) -> dict:
+    """
+    Remaining OpenWeather call budget per bucket. Only for admins.
+    """
+    return get_rate_limit_snapshot()
+
+
+@router.get("/circuit")
+async def read_circuit_state(current_user: models.User = Depends(check_admin)) -> dict:
+    """
+    State of the OpenWeather circuit breaker. Only for admins.
+    """
+    return get_circuit_snapshot()
+
+
+@router.get("/hot-cities")
+async def read_hot_cities(current_user: models.User = Depends(check_admin)) -> dict:
+    """
+    Most requested cities and how many forecasts are precomputed. Only for admins.
+    """
+    return get_hot_cities_snapshot()
+
+
+@router.get("/cache/forecast")
+async def read_forecast_cache_stats(current_user: models.User = Depends(check_admin)) -> dict:
+    """
+    Hit rate and approximate memory use of the memoized forecasts. Only for admins.
+    """
+    return get_forecast_cache_stats()
+
+
+@router.get("/models", response_model=List[schemas.ModelVersionRead])
+async def read_model_versions(
+    current_user: models.User = Depends(check_admin),
+) -> List[schemas.ModelVersionRead]:
+    """
+    List model versions in the registry. Only for admins.
+    """
+    active = active_version()
+    return [
+        schemas.ModelVersionRead(
+            version=artifacts.version,
+            active=artifacts.version == active,
+            created_at=artifacts.metadata.get("created_at"),
+            metadata=artifacts.metadata,
+        )
+        for artifacts in list_versions()
+    ]
+
+
+@router.post("/models/{version}/activate", response_model=schemas.ModelVersionRead)
+async def activate_model_version(
+    version: str,
+    current_user: models.User = Depends(check_admin),
+) -> schemas.ModelVersionRead:
+    """
+    Load, warm up and then switch predictions to a model version. Only for admins.
+    """
+    try:
+        await activate_version(version)
+    except ModelNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(exc)) from exc
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=str(exc)) from exc
+    artifacts = next(a for a in list_versions() if a.version == version)
+    return schemas.ModelVersionRead(
+        version=version,
+        active=True,
+        created_at=artifacts.metadata.get("created_at"),
+        metadata=artifacts.metadata,
+    )
@@ -6,7 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_user_by_email
 from app.core.config import settings
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.security import (
+    create_access_token,
+    get_password_hash_async,
+    verify_and_update_password_async,
+)
 from app.db import models
 from app.db.schemas import Token, UserCreate, UserLogin, UserRead
 from app.db.session import get_db
@@ -22,7 +26,7 @@ async def signup(payload: UserCreate, db: AsyncSession = Depends(get_db)) -> Use
     user = models.User(
         email=payload.email,
         full_name=payload.full_name,
-        hashed_password=get_password_hash(payload.password),
+        hashed_password=await get_password_hash_async(payload.password),
     )
     db.add(user)
     await db.commit()
@@ -36,8 +40,15 @@ async def login(
     db: AsyncSession = Depends(get_db),
 ) -> Token:
     user = await get_user_by_email(db, form_data.username)
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    verified, new_hash = await verify_and_update_password_async(form_data.password, user.hashed_password)
+    if not verified:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid credentials")
+    if new_hash:
+        # Stored hash used outdated settings (e.g. BCRYPT_ROUNDS changed)
+        user.hashed_password = new_hash
+        await db.commit()
     token = create_access_token(
         subject=user.email,
         expires_delta=timedelta(minutes=settings.access_token_expire_minutes),
@@ -2,17 +2,63 @@
 AI Weather Prediction Endpoints
 Protected routes for authenticated users only
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.api.deps import get_current_user
+from app.api.streaming import StreamFormat, stream_models
+from app.api.routes.weather import check_batch_size
+from app.core.config import settings
 from app.db.models import User
-from app.db.schemas import PredictionResponse, PredictionDay
-from app.ml.predictor import get_predictor
-from app.services.weather_client import WeatherClientError, fetch_current_weather
+from app.db.schemas import (
+    CityBatchRequest,
+    PredictionBatchItem,
+    PredictionBatchResponse,
+    PredictionDay,
+    PredictionResponse,
+    WeatherResponse,
+)
+from app.ml.executor import InferenceOverloaded
+from app.ml.service import Forecast, predict_weather, predict_weather_many
+from app.services.concurrency import bounded_map
+from app.services.hot_cities import get_precomputed, record_request
+from app.services.observations import get_histories, get_history
+from app.services.weather_client import (
+    WeatherClientError,
+    fetch_current_weather,
+    fetch_current_weather_many,
+    normalize_city,
+)
 
 router = APIRouter(prefix="/api", tags=["predictions"])
 
 
+def build_prediction_response(current_weather: WeatherResponse, forecast: Forecast) -> PredictionResponse:
+    prediction_days = [
+        PredictionDay(
+            day=p["day"],
+            temperature_c=p["temperature_c"],
+            humidity=p["humidity"],
+            precipitation_mm=p["precipitation_mm"],
+        )
+        for p in forecast.days
+    ]
+
+    return PredictionResponse(
+        city=current_weather.city,
+        country=current_weather.country,
+        predictions=prediction_days,
+        model_version=forecast.model_version,
+    )
+
+
+def overloaded_exception(exc: InferenceOverloaded) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=str(exc),
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+
 @router.get("/predict", response_model=PredictionResponse)
 async def get_weather_prediction(
     city: str = Query(..., min_length=2),
@@ -22,39 +68,103 @@ async def get_weather_prediction(
     Get AI-powered 7-day weather prediction for a city
     Requires authentication
     """
+    if settings.hot_cities_enabled:
+        precomputed = get_precomputed(city)
+        if precomputed is not None:
+            record_request(city)
+            return build_prediction_response(*precomputed)
+
     try:
         # Get current weather to use as input for prediction
         current_weather = await fetch_current_weather(city)
 
-        # Get predictor
-        predictor = get_predictor()
+        # Only cities upstream recognises count towards the hot list
+        if settings.hot_cities_enabled:
+            record_request(city)
 
-        # Generate prediction
-        predictions = predictor.predict(
-            current_temp=current_weather.metrics.temperature_c,
-            current_humidity=current_weather.metrics.humidity,
-            current_precip=0.0,  # Use 0 if not available
-        )
+        # Last 14 days of observations for the city, ending with today
+        history = await get_history(normalize_city(city), current_weather)
+
+        # Generate prediction (batched with concurrent requests)
+        forecast = await predict_weather(history)
 
         # Format response
-        prediction_days = [
-            PredictionDay(
-                day=p["day"],
-                temperature_c=p["temperature_c"],
-                humidity=p["humidity"],
-                precipitation_mm=p["precipitation_mm"],
-            )
-            for p in predictions
-        ]
-
-        return PredictionResponse(
-            city=current_weather.city,
-            country=current_weather.country,
-            predictions=prediction_days,
-        )
+        return build_prediction_response(current_weather, forecast)
 
     except WeatherClientError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
+    except InferenceOverloaded as exc:
+        raise overloaded_exception(exc) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Prediction error: {str(exc)}") from exc
 
+
+@router.post("/predict:batch", response_model=PredictionBatchResponse)
+async def get_weather_prediction_batch(
+    payload: CityBatchRequest,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    7-day predictions for several cities in one batched forward pass;
+    upstream failures are reported per city. Requires authentication
+    """
+    check_batch_size(payload)
+    weather = await fetch_current_weather_many(payload.cities, settings.batch_fetch_concurrency)
+    fetched = [
+        (normalize_city(city), w)
+        for city, w in zip(payload.cities, weather)
+        if not isinstance(w, WeatherClientError)
+    ]
+
+    try:
+        histories = await get_histories([key for key, _ in fetched], [w for _, w in fetched])
+        forecasts = await predict_weather_many(histories)
+    except InferenceOverloaded as exc:
+        raise overloaded_exception(exc) from exc
+    except Exception as exc:
+        raise HTTPException(status_code=500, detail=f"Prediction error: {str(exc)}") from exc
+
+    forecast_iter = iter(forecasts)
+    results = []
+    for city, current_weather in zip(payload.cities, weather):
+        if isinstance(current_weather, WeatherClientError):
+            results.append(PredictionBatchItem(city=city, error=str(current_weather)))
+        else:
+            response = build_prediction_response(current_weather, next(forecast_iter))
+            results.append(PredictionBatchItem(city=city, result=response))
+    return PredictionBatchResponse(results=results)
+
+
+async def _prediction_item(city: str) -> PredictionBatchItem:
+    try:
+        current_weather = await fetch_current_weather(city)
+        forecast = await predict_weather(await get_history(normalize_city(city), current_weather))
+    except (WeatherClientError, InferenceOverloaded) as exc:
+        return PredictionBatchItem(city=city, error=str(exc))
+    except Exception as exc:
+        return PredictionBatchItem(city=city, error=f"Prediction error: {str(exc)}")
+    return PredictionBatchItem(city=city, result=build_prediction_response(current_weather, forecast))
+
+
+@router.post("/predict:stream")
+async def stream_weather_predictions(
+    payload: CityBatchRequest,
+    format: StreamFormat = StreamFormat.NDJSON,
+    ordered: bool = False,
+    current_user: User = Depends(get_current_user),
+):
+    """
+    Stream 7-day predictions per city as soon as each one is ready
+    (NDJSON lines or server-sent events). Concurrent cities share forward
+    passes through the micro-batcher. Requires authentication
+    """
+    check_batch_size(payload, settings.stream_max_cities)
+
+    async def items():
+        async for index, item in bounded_map(
+            payload.cities, _prediction_item, settings.batch_fetch_concurrency, ordered
+        ):
+            item.index = index
+            yield item
+
+    return stream_models(items(), format)
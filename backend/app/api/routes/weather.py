@@ -1,11 +1,27 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, status
 
-from app.db.schemas import WeatherResponse
-from app.services.weather_client import WeatherClientError, fetch_current_weather
+from app.api.streaming import StreamFormat, stream_models
+from app.core.config import settings
+from app.db.schemas import CityBatchRequest, WeatherBatchItem, WeatherBatchResponse, WeatherResponse
+from app.services.concurrency import bounded_map
+from app.services.weather_client import (
+    WeatherClientError,
+    fetch_current_weather,
+    fetch_current_weather_many,
+)
 
 router = APIRouter(prefix="/api", tags=["weather"])
 
 
+def check_batch_size(payload: CityBatchRequest, limit: int | None = None) -> None:
+    limit = limit or settings.batch_max_cities
+    if len(payload.cities) > limit:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"At most {limit} cities per request",
+        )
+
+
 @router.get("/current", response_model=WeatherResponse)
 async def get_current_weather(city: str = Query(..., min_length=2)) -> WeatherResponse:
     try:
@@ -13,3 +29,49 @@ async def get_current_weather(city: str = Query(..., min_length=2)) -> WeatherRe
     except WeatherClientError as exc:
         raise HTTPException(status_code=502, detail=str(exc)) from exc
 
+
+@router.post("/current:batch", response_model=WeatherBatchResponse)
+async def get_current_weather_batch(payload: CityBatchRequest) -> WeatherBatchResponse:
+    """
+    Current weather for several cities; failures are reported per city
+    """
+    check_batch_size(payload)
+    results = await fetch_current_weather_many(payload.cities, settings.batch_fetch_concurrency)
+    return WeatherBatchResponse(
+        results=[
+            WeatherBatchItem(city=city, error=str(result))
+            if isinstance(result, WeatherClientError)
+            else WeatherBatchItem(city=city, result=result)
+            for city, result in zip(payload.cities, results)
+        ]
+    )
+
+
+async def _weather_item(city: str) -> WeatherBatchItem:
+    try:
+        return WeatherBatchItem(city=city, result=await fetch_current_weather(city))
+    except WeatherClientError as exc:
+        return WeatherBatchItem(city=city, error=str(exc))
+
+
+@router.post("/current:stream")
+async def stream_current_weather(
+    payload: CityBatchRequest,
+    format: StreamFormat = StreamFormat.NDJSON,
+    ordered: bool = False,
+):
+    """
+    Stream current weather per city as soon as each lookup finishes
+    (NDJSON lines or server-sent events). Each item carries its input index;
+    pass ordered=true to receive them in input order instead.
+    """
+    check_batch_size(payload, settings.stream_max_cities)
+
+    async def items():
+        async for index, item in bounded_map(
+            payload.cities, _weather_item, settings.batch_fetch_concurrency, ordered
+        ):
+            item.index = index
+            yield item
+
+    return stream_models(items(), format)
@@ -0,0 +1,38 @@
+"""
+Helpers for streaming per-item results as NDJSON or server-sent events
+"""
+from enum import Enum
+from typing import AsyncIterator
+
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+
+class StreamFormat(str, Enum):
+    NDJSON = "ndjson"
+    SSE = "sse"
+
+
+MEDIA_TYPES = {
+    StreamFormat.NDJSON: "application/x-ndjson",
+    StreamFormat.SSE: "text/event-stream",
+}
+
+
+async def _encode(items: AsyncIterator[BaseModel], fmt: StreamFormat) -> AsyncIterator[str]:
+    async for item in items:
+        payload = item.model_dump_json()
+        if fmt is StreamFormat.SSE:
+            yield f"data: {payload}\n\n"
+        else:
+            yield payload + "\n"
+
+
+def stream_models(items: AsyncIterator[BaseModel], fmt: StreamFormat) -> StreamingResponse:
+    """Stream each model as soon as the iterator produces it"""
+    return StreamingResponse(
+        _encode(items, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        # Keep reverse proxies from buffering the stream
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -15,12 +15,92 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 60
     jwt_algorithm: str = "HS256"
 
+    auth_cache_enabled: bool = True
+    auth_cache_ttl_seconds: float = 30.0
+    auth_cache_max_entries: int = 10000
+
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 4  # 0 hashes inline on the event loop
+    password_hash_max_concurrency: int = 64
+
     openweather_api_key: str | None = None
+    # Point at scripts/openweather_stub.py for load tests
+    openweather_base_url: str = "https://api.openweathermap.org/data/2.5/weather"
+
+    # Free tier quota; budgets are per process, so divide by the worker count
+    openweather_rate_limit_enabled: bool = True
+    openweather_calls_per_minute: int = 60
+    openweather_calls_per_day: int = 1000
+    openweather_rate_limit_wait_seconds: float = 2.0
+
+    openweather_retry_attempts: int = 3
+    openweather_retry_base_delay_seconds: float = 0.2
+    openweather_retry_max_delay_seconds: float = 2.0
+    openweather_circuit_failure_threshold: int = 5
+    openweather_circuit_reset_seconds: float = 30.0
+
+    http_max_connections: int = 100
+    http_max_keepalive_connections: int = 20
+    http_keepalive_expiry_seconds: float = 30.0
+    http2_enabled: bool = False
+    http_connect_timeout_seconds: float = 5.0
+    http_read_timeout_seconds: float = 10.0
+    http_write_timeout_seconds: float = 5.0
+    http_pool_timeout_seconds: float = 5.0
+
+    weather_cache_enabled: bool = True
+    weather_cache_ttl_seconds: float = 600.0
+    weather_cache_stale_seconds: float = 300.0
+    weather_cache_max_entries: int = 1024
+    # Second tier in the app database, shared by all workers
+    weather_cache_db_enabled: bool = False
+    weather_cache_db_compaction_interval_seconds: float = 300.0
 
     allowed_origins: List[str] = ["http://localhost:3000"]
 
+    metrics_enabled: bool = True
+
+    hot_cities_enabled: bool = False
+    hot_cities_top_k: int = 50
+    hot_cities_refresh_interval_seconds: float = 300.0
+    hot_cities_half_life_seconds: float = 3600.0
+    hot_cities_max_tracked: int = 10000
+
+    # Daily aggregates of upstream observations, fed to the model as its 14 day input
+    observation_store_enabled: bool = True
+    observation_history_days: int = 30
+    observation_max_cities: int = 10000
+    observation_prune_interval_seconds: float = 3600.0
+
+    batch_max_cities: int = 100
+    batch_fetch_concurrency: int = 10
+    stream_max_cities: int = 1000
+
     ml_model_path: str = "../ml/models/weather_lstm.pt"
     ml_scaler_path: str = "../ml/models/scaler.pkl"
+    ml_backend: str = "torch"  # "torch" or "numpy"
+    ml_numpy_weights_path: str = "../ml/models/weather_lstm.npz"
+    ml_registry_path: str | None = "../ml/models/registry"
+    ml_registry_poll_seconds: float = 1.0
+
+    ml_batching_enabled: bool = True
+    ml_batch_max_size: int = 32
+    ml_batch_max_latency_ms: float = 5.0
+
+    ml_executor: str = "thread"  # "thread" or "process"
+    ml_executor_workers: int = 1
+    ml_torch_threads: int = 1
+    ml_max_pending_requests: int = 256
+    ml_retry_after_seconds: int = 1
+
+    ml_warmup_enabled: bool = True
+    ml_warmup_batches: int = 3
+
+    ml_forecast_cache_enabled: bool = True
+    ml_forecast_cache_max_entries: int = 4096
+    ml_forecast_temp_resolution: float = 0.1
+    ml_forecast_humidity_resolution: float = 1.0
+    ml_forecast_precip_resolution: float = 0.1
 
 
 @lru_cache
@@ -1,19 +1,26 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Optional
+from typing import Any, Optional, Tuple
 
 from jose import jwt
 from passlib.context import CryptContext
 
 from .config import settings
 
-# Configure bcrypt with compatible settings
+# Configure bcrypt with compatible settings. Hashes made with a different
+# round count are flagged by verify_and_update and rehashed on login.
 pwd_context = CryptContext(
     schemes=["bcrypt"],
     deprecated="auto",
-    bcrypt__rounds=12,
+    bcrypt__rounds=settings.bcrypt_rounds,
     bcrypt__ident="2b",  # Use 2b identifier for better compatibility
 )
 
+# bcrypt releases the GIL, so a thread pool keeps hashing off the event loop
+_hash_executor: Optional[ThreadPoolExecutor] = None
+_hash_slots: Optional[asyncio.Semaphore] = None
+
 
 def create_access_token(subject: str, expires_delta: Optional[timedelta] = None) -> str:
     to_encode: dict[str, Any] = {"sub": subject}
@@ -27,16 +34,61 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
-def get_password_hash(password: str) -> str:
-    """
-    Hash a password using bcrypt.
-    Bcrypt has a 72-byte limit, so we truncate if necessary.
-    """
+def _truncate_password(password: str) -> str:
     # Bcrypt has a 72-byte limit, truncate if password is too long
     if isinstance(password, str):
         password_bytes = password.encode('utf-8')
         if len(password_bytes) > 72:
             password_bytes = password_bytes[:72]
         password = password_bytes.decode('utf-8', errors='ignore')
-    return pwd_context.hash(password)
+    return password
+
+
+def get_password_hash(password: str) -> str:
+    """
+    Hash a password using bcrypt.
+    Bcrypt has a 72-byte limit, so we truncate if necessary.
+    """
+    return pwd_context.hash(_truncate_password(password))
+
+
+def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and return a replacement hash when the stored one was
+    made with outdated settings (e.g. a different bcrypt round count).
+    """
+    return pwd_context.verify_and_update(_truncate_password(plain_password), hashed_password)
+
+
+async def _run_hasher(fn, *args):
+    global _hash_executor, _hash_slots
+    if settings.password_hash_workers <= 0:
+        return fn(*args)
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.password_hash_workers, thread_name_prefix="bcrypt"
+        )
+        _hash_slots = asyncio.Semaphore(settings.password_hash_max_concurrency)
+    async with _hash_slots:
+        return await asyncio.get_running_loop().run_in_executor(_hash_executor, fn, *args)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the bounded hashing pool"""
+    return await _run_hasher(get_password_hash, password)
+
+
+async def verify_and_update_password_async(
+    plain_password: str, hashed_password: str
+) -> Tuple[bool, Optional[str]]:
+    """verify_and_update_password on the bounded hashing pool"""
+    return await _run_hasher(verify_and_update_password, plain_password, hashed_password)
+
+
+def shutdown_password_hasher() -> None:
+    global _hash_executor, _hash_slots
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False)
+        _hash_executor = None
+        _hash_slots = None
 
@@ -1,6 +1,6 @@
-from datetime import datetime
+from datetime import date, datetime
 
-from sqlalchemy import String, func
+from sqlalchemy import Float, String, Text, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from .base import Base
@@ -16,3 +16,26 @@ class User(Base):
     is_admin: Mapped[bool] = mapped_column(default=False, nullable=False)
     created_at: Mapped[datetime] = mapped_column(default=func.now(), nullable=False)
 
+
+class WeatherCacheEntry(Base):
+    """Serialized WeatherResponse shared by all workers through the database"""
+
+    __tablename__ = "weather_cache"
+
+    city_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    payload: Mapped[str] = mapped_column(Text, nullable=False)
+    fetched_at: Mapped[datetime] = mapped_column(nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(index=True, nullable=False)
+
+
+class WeatherObservation(Base):
+    """Running sums of one city's upstream observations for one UTC day"""
+
+    __tablename__ = "weather_observations"
+
+    city_key: Mapped[str] = mapped_column(String(255), primary_key=True)
+    day: Mapped[date] = mapped_column(primary_key=True, index=True)
+    temperature_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    humidity_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    precipitation_sum: Mapped[float] = mapped_column(Float, nullable=False)
+    count: Mapped[int] = mapped_column(nullable=False)
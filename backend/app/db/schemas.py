@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import Annotated, List
 
 from pydantic import BaseModel, EmailStr, Field
 
@@ -41,6 +41,7 @@ class WeatherMetrics(BaseModel):
     temperature_c: float
     humidity: float
     wind_speed: float
+    precipitation_mm: float = 0.0  # rain + snow over the last hour
     description: str
     icon: str
 
@@ -63,4 +64,41 @@ class PredictionResponse(BaseModel):
     city: str
     country: str
     predictions: List[PredictionDay]
+    model_version: str | None = None
+
+    class Config:
+        protected_namespaces = ()
+
+
+class CityBatchRequest(BaseModel):
+    cities: List[Annotated[str, Field(min_length=2)]] = Field(min_length=1)
+
+
+class WeatherBatchItem(BaseModel):
+    city: str
+    index: int | None = None
+    result: WeatherResponse | None = None
+    error: str | None = None
+
+
+class WeatherBatchResponse(BaseModel):
+    results: List[WeatherBatchItem]
+
+
+class PredictionBatchItem(BaseModel):
+    city: str
+    index: int | None = None
+    result: PredictionResponse | None = None
+    error: str | None = None
+
+
+class PredictionBatchResponse(BaseModel):
+    results: List[PredictionBatchItem]
+
+
+class ModelVersionRead(BaseModel):
+    version: str
+    active: bool
+    created_at: str | None = None
+    metadata: dict = {}
 
@@ -3,14 +3,35 @@ WeatherWise FastAPI Main Application
 """
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, PlainTextResponse
 from loguru import logger
 
 from app.api.routes import admin, auth, predictions, weather
 from app.core.config import settings
+from app.core.metrics import MetricsMiddleware, registry
+from app.core.security import shutdown_password_hasher
 from app.db.base import Base
 from app.db.session import engine
+from app.ml.service import (
+    get_batcher,
+    get_forecast_cache_stats,
+    get_pending_requests,
+    readiness,
+    start_inference,
+    stop_inference,
+)
+from app.services.hot_cities import start_hot_cities, stop_hot_cities
+from app.services.observations import start_pruning, stop_pruning
+from app.services.shared_cache import start_compaction, stop_compaction
+from app.services.weather_client import (
+    close_http_client,
+    get_circuit_snapshot,
+    get_rate_limit_snapshot,
+    get_weather_cache_stats,
+    start_http_client,
+)
 
 
 @asynccontextmanager
@@ -25,10 +46,22 @@ async def lifespan(app: FastAPI):
         await conn.run_sync(Base.metadata.create_all)
     
     logger.info("Database tables created/verified")
+
+    await start_http_client()
+    await start_inference()
+    await start_compaction()
+    await start_pruning()
+    await start_hot_cities()
     yield
     
     # Shutdown
     logger.info("Shutting down WeatherWise API...")
+    await stop_hot_cities()
+    await stop_pruning()
+    await stop_compaction()
+    await stop_inference()
+    await close_http_client()
+    shutdown_password_hasher()
 
 
 app = FastAPI(
@@ -47,6 +80,9 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+
 # Include routers
 app.include_router(auth.router)
 app.include_router(weather.router)
@@ -69,3 +105,78 @@ async def health_check():
     """Health check endpoint"""
     return {"status": "healthy"}
 
+
+def _register_gauges() -> None:
+    """Expose the stats the admin endpoints already compute as scrape-time gauges"""
+
+    def weather_cache():
+        stats = get_weather_cache_stats()
+        return {
+            ("size",): stats.size,
+            ("hits",): stats.hits,
+            ("stale_hits",): stats.stale_hits,
+            ("misses",): stats.misses,
+        }
+
+    def forecast_cache():
+        stats = get_forecast_cache_stats()
+        return {(key,): stats[key] for key in ("size", "hits", "misses", "approx_bytes")}
+
+    def rate_limit():
+        buckets = get_rate_limit_snapshot()["buckets"]
+        return {(name,): bucket["remaining"] for name, bucket in buckets.items()}
+
+    def batcher():
+        stats = get_batcher().stats
+        return {
+            ("batches",): stats.batches,
+            ("items",): stats.items,
+            ("mean_batch_size",): stats.mean_batch_size,
+        }
+
+    registry.gauge_callback(
+        "weatherwise_weather_cache", "Weather cache counters", weather_cache, ("stat",)
+    )
+    registry.gauge_callback(
+        "weatherwise_forecast_cache", "Forecast cache counters", forecast_cache, ("stat",)
+    )
+    registry.gauge_callback(
+        "weatherwise_openweather_tokens_remaining",
+        "Tokens left in each OpenWeather quota bucket",
+        rate_limit,
+        ("bucket",),
+    )
+    registry.gauge_callback(
+        "weatherwise_circuit_open",
+        "1 when the OpenWeather circuit breaker is open",
+        lambda: {(): float(get_circuit_snapshot()["state"] == "open")},
+    )
+    registry.gauge_callback(
+        "weatherwise_inference_batcher", "Micro-batcher counters", batcher, ("stat",)
+    )
+    registry.gauge_callback(
+        "weatherwise_inference_pending",
+        "Prediction inputs admitted but not yet answered",
+        lambda: {(): get_pending_requests()},
+    )
+
+
+_register_gauges()
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of request, stage and cache metrics"""
+    if not settings.metrics_enabled:
+        return JSONResponse(status_code=status.HTTP_404_NOT_FOUND, content={"detail": "Not Found"})
+    return PlainTextResponse(registry.render(), media_type="text/plain; version=0.0.4")
+
+
+@app.get("/ready")
+async def readiness_check():
+    """Readiness probe: only healthy once the prediction model is loaded and warm"""
+    ready, error = readiness()
+    if ready:
+        return {"status": "ready"}
+    content = {"status": "failed", "detail": error} if error else {"status": "warming_up"}
+    return JSONResponse(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, content=content)
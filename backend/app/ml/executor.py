@@ -0,0 +1,92 @@
+"""
+Worker pool that keeps model inference off the event loop
+"""
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+from typing import Any, Callable, List, Optional
+
+from app.core.config import settings
+
+
+class InferenceOverloaded(Exception):
+    """Raised when too many predictions are already queued"""
+
+    def __init__(self, retry_after: int):
+        super().__init__("Prediction service is saturated, retry later")
+        self.retry_after = retry_after
+
+
+def _set_torch_threads(num_threads: int) -> None:
+    """Size torch's intra-op pool; the setting applies to the whole process"""
+    if num_threads > 0 and settings.ml_backend == "torch":
+        import torch
+
+        torch.set_num_threads(num_threads)
+
+
+# How long a worker waits for the others during run_on_each_worker
+_EACH_WORKER_TIMEOUT_SECONDS = 300.0
+
+
+def _call_then_wait(barrier, fn: Callable[..., Any], *args: Any) -> Any:
+    result = fn(*args)
+    # Hold this worker until every worker has taken a call, so none runs two
+    barrier.wait()
+    return result
+
+
+class InferenceExecutor:
+    """
+    Thread or process pool for blocking inference calls. With the torch backend
+    ``num_threads`` caps torch's intra-op threads so workers don't oversubscribe
+    the CPU: each process worker gets its own pool of that size, while thread
+    workers all share the API process's single pool, sized once on start.
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: int = 1, num_threads: int = 1):
+        if kind not in ("thread", "process"):
+            raise ValueError(f"Unknown executor kind '{kind}', expected 'thread' or 'process'")
+        self.kind = kind
+        self.max_workers = max_workers
+        self.num_threads = num_threads
+        self._pool: Optional[Executor] = None
+
+    def start(self) -> None:
+        if self._pool is not None:
+            return
+        if self.kind == "process":
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_set_torch_threads,
+                initargs=(self.num_threads,),
+            )
+        else:
+            _set_torch_threads(self.num_threads)
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="inference")
+
+    def shutdown(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        self.start()
+        return await asyncio.get_running_loop().run_in_executor(self._pool, fn, *args)
+
+    async def run_on_each_worker(self, fn: Callable[..., Any], *args: Any) -> List[Any]:
+        """
+        Call ``fn`` once in every worker process. Thread workers share this
+        process's state, so there a single call covers all of them.
+        """
+        if self.kind == "thread":
+            return [await self.run(fn, *args)]
+        manager = await asyncio.to_thread(multiprocessing.get_context("spawn").Manager)
+        try:
+            barrier = manager.Barrier(self.max_workers, timeout=_EACH_WORKER_TIMEOUT_SECONDS)
+            return await asyncio.gather(
+                *(self.run(_call_then_wait, barrier, fn, *args) for _ in range(self.max_workers))
+            )
+        finally:
+            await asyncio.to_thread(manager.shutdown)
@@ -0,0 +1,72 @@
+"""
+Pure-NumPy inference backend for the weather LSTM
+
+Executes the same computation as WeatherLSTM in eval mode from weights
+exported to a .npz file, so serving doesn't need to import torch.
+"""
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+
+def _sigmoid(x: np.ndarray) -> np.ndarray:
+    # tanh form avoids overflow warnings for large negative inputs
+    return 0.5 * (np.tanh(0.5 * x) + 1.0)
+
+
+class NumpyWeatherLSTM:
+    """Stacked LSTM + linear head using PyTorch's gate layout (i, f, g, o)"""
+
+    def __init__(self, weights: Dict[str, np.ndarray]):
+        self.layers: List[Tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        layer = 0
+        while f"lstm.weight_ih_l{layer}" in weights:
+            w_ih = weights[f"lstm.weight_ih_l{layer}"].astype(np.float32)
+            w_hh = weights[f"lstm.weight_hh_l{layer}"].astype(np.float32)
+            bias = (weights[f"lstm.bias_ih_l{layer}"] + weights[f"lstm.bias_hh_l{layer}"]).astype(np.float32)
+            # Pre-transpose so every gate computation is a single (B, in) @ (in, 4H) matmul
+            self.layers.append((np.ascontiguousarray(w_ih.T), np.ascontiguousarray(w_hh.T), bias))
+            layer += 1
+        if not self.layers:
+            raise ValueError("No LSTM weights found in weight file")
+        self.hidden_size = self.layers[0][1].shape[0]
+        self.fc_weight = np.ascontiguousarray(weights["fc.weight"].astype(np.float32).T)
+        self.fc_bias = weights["fc.bias"].astype(np.float32)
+
+    @classmethod
+    def load(cls, path: Path) -> "NumpyWeatherLSTM":
+        with np.load(path) as data:
+            return cls({key: data[key] for key in data.files})
+
+    def predict(self, sequences: np.ndarray) -> np.ndarray:
+        """Map scaled (B, T, 3) sequences to scaled (B, 21) outputs"""
+        x = np.asarray(sequences, dtype=np.float32)
+        batch_size, steps, _ = x.shape
+        hidden = self.hidden_size
+
+        for w_ih, w_hh, bias in self.layers:
+            # Input contribution for every timestep in one matmul: (B, T, 4H)
+            input_gates = x @ w_ih + bias
+            h = np.zeros((batch_size, hidden), dtype=np.float32)
+            c = np.zeros((batch_size, hidden), dtype=np.float32)
+            outputs = np.empty((batch_size, steps, hidden), dtype=np.float32)
+            for t in range(steps):
+                gates = input_gates[:, t] + h @ w_hh
+                # One sigmoid over all four gates is cheaper than four small calls
+                activated = _sigmoid(gates)
+                g = np.tanh(gates[:, 2 * hidden : 3 * hidden])
+                c = activated[:, hidden : 2 * hidden] * c + activated[:, :hidden] * g
+                h = activated[:, 3 * hidden :] * np.tanh(c)
+                outputs[:, t] = h
+            x = outputs
+
+        return x[:, -1] @ self.fc_weight + self.fc_bias
+
+
+def export_npz(model_path: Path, npz_path: Path) -> None:
+    """Convert a torch state_dict checkpoint into a .npz weight file"""
+    import torch
+
+    state_dict = torch.load(model_path, map_location="cpu")
+    np.savez(npz_path, **{key: value.cpu().numpy() for key, value in state_dict.items()})
@@ -3,57 +3,57 @@ ML Weather Prediction Service
 Loads trained model and generates 7-day forecasts
 """
 import pickle
-from pathlib import Path
-from typing import List
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Sequence, Tuple
 
 import numpy as np
-import torch
-import torch.nn as nn
 
 from app.core.config import settings
+from app.core.metrics import timed
+from app.ml.registry import ModelArtifacts, active_version, get_artifacts
 
+SEQUENCE_LENGTH = 14
 
-class WeatherLSTM(nn.Module):
-    """LSTM model for weather prediction"""
+# A 14 day history of (temperature, humidity, precipitation) rows, or one such row
+PredictorInput = Sequence[float] | Sequence[Sequence[float]]
+# (stage, seconds) spans measured during one predict_batch call
+StageTimings = List[Tuple[str, float]]
 
-    def __init__(self, input_size=3, hidden_size=64, num_layers=2, output_size=21):
-        super(WeatherLSTM, self).__init__()
-        self.hidden_size = hidden_size
-        self.num_layers = num_layers
 
-        self.lstm = nn.LSTM(
-            input_size, hidden_size, num_layers, batch_first=True, dropout=0.2
-        )
-        self.fc = nn.Linear(hidden_size, output_size)
-
-    def forward(self, x):
-        lstm_out, _ = self.lstm(x)
-        last_output = lstm_out[:, -1, :]
-        output = self.fc(last_output)
-        return output
+@contextmanager
+def _stage(name: str, timings: Optional[StageTimings]) -> Iterator[None]:
+    """Time a block into ``timings`` when given, else straight into this process's metrics"""
+    if timings is None:
+        with timed(name):
+            yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.append((name, time.perf_counter() - start))
 
 
 class WeatherPredictor:
     """Weather prediction service"""
 
-    def __init__(self):
+    def __init__(self, artifacts: ModelArtifacts, backend: str | None = None):
         self.model = None
         self.scaler = None
-        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        self.artifacts = artifacts
+        self.version = artifacts.version
+        self.backend = backend or settings.ml_backend
         self._load_model()
 
     def _load_model(self):
         """Load trained model and scaler"""
-        # Resolve paths - try relative to backend, then absolute
-        base_path = Path(__file__).parent.parent.parent  # Go to project root
-        model_path = (base_path / settings.ml_model_path.lstrip("../")).resolve()
-        scaler_path = (base_path / settings.ml_scaler_path.lstrip("../")).resolve()
-        
-        # Fallback to direct path if not found
-        if not model_path.exists():
-            model_path = Path(settings.ml_model_path).resolve()
-        if not scaler_path.exists():
-            scaler_path = Path(settings.ml_scaler_path).resolve()
+        if self.backend not in ("torch", "numpy"):
+            raise ValueError(f"Unknown ML backend '{self.backend}', expected 'torch' or 'numpy'")
+        model_path = self.artifacts.weights_path(self.backend)
+        scaler_path = self.artifacts.scaler_path
 
         if not model_path.exists() or not scaler_path.exists():
             raise FileNotFoundError(
@@ -64,11 +64,15 @@ class WeatherPredictor:
         with open(scaler_path, "rb") as f:
             self.scaler = pickle.load(f)
 
-        # Load model
-        self.model = WeatherLSTM(input_size=3, hidden_size=64, num_layers=2, output_size=21)
-        self.model.load_state_dict(torch.load(model_path, map_location=self.device))
-        self.model.eval()
-        self.model = self.model.to(self.device)
+        # Load model; torch is only imported when the torch backend is selected
+        if self.backend == "numpy":
+            from app.ml.numpy_model import NumpyWeatherLSTM
+
+            self.model = NumpyWeatherLSTM.load(model_path)
+        else:
+            from app.ml.torch_model import TorchWeatherModel
+
+            self.model = TorchWeatherModel(model_path)
 
     def predict(
         self, current_temp: float, current_humidity: float, current_precip: float
@@ -84,50 +88,104 @@ class WeatherPredictor:
         Returns:
             List of 7 day predictions with temp, humidity, precip
         """
-        # Create a simple sequence from current values (repeat for sequence length)
-        sequence_length = 14
-        sequence = np.array([[current_temp, current_humidity, current_precip]] * sequence_length)
+        return self.predict_batch([(current_temp, current_humidity, current_precip)])[0]
 
-        # Normalize
-        sequence_scaled = self.scaler.transform(sequence)
+    def predict_batch(
+        self, inputs: Sequence[PredictorInput], timings: Optional[StageTimings] = None
+    ) -> List[List[dict]]:
+        """
+        Predict next 7 days of weather for several inputs in one forward pass
 
-        # Convert to tensor
-        sequence_tensor = torch.FloatTensor(sequence_scaled).unsqueeze(0).to(self.device)
+        Args:
+            inputs: 14 daily (temperature, humidity, precipitation) rows per
+                input, oldest first, or a single current (temperature,
+                humidity, precipitation) tuple repeated over the 14 days
+            timings: if given, per-stage latencies are appended here instead
+                of being recorded in this process's metrics
 
-        # Predict
-        with torch.no_grad():
-            prediction = self.model(sequence_tensor)
-            prediction = prediction.cpu().numpy()[0]
-
-        # Reshape: 21 values -> 7 days * 3 features
-        prediction_reshaped = prediction.reshape(7, 3)
-
-        # Denormalize
-        prediction_denorm = self.scaler.inverse_transform(prediction_reshaped)
-
-        # Format results
-        results = []
-        for day in range(7):
-            results.append(
-                {
-                    "day": day + 1,
-                    "temperature_c": round(float(prediction_denorm[day][0]), 2),
-                    "humidity": round(float(prediction_denorm[day][1]), 2),
-                    "precipitation_mm": round(float(max(0, prediction_denorm[day][2])), 2),
-                }
+        Returns:
+            One list of 7 day predictions per input, in input order
+        """
+        if not inputs:
+            return []
+
+        batch_size = len(inputs)
+        sequences = np.asarray(inputs, dtype=np.float64)
+        if sequences.ndim == 2:
+            sequences = np.repeat(sequences.reshape(batch_size, 1, 3), SEQUENCE_LENGTH, axis=1)
+        if sequences.shape[1:] != (SEQUENCE_LENGTH, 3):
+            raise ValueError(f"Expected inputs of shape ({SEQUENCE_LENGTH}, 3), got {sequences.shape[1:]}")
+
+        # Normalize all rows at once, then restore the (B, 14, 3) shape
+        with _stage("scaler_transform", timings):
+            sequences_scaled = self.scaler.transform(sequences.reshape(-1, 3)).reshape(
+                batch_size, SEQUENCE_LENGTH, 3
             )
 
-        return results
-
+        # Predict
+        with _stage("forward_pass", timings):
+            prediction = self.model.predict(sequences_scaled)
 
-# Global predictor instance
-_predictor_instance = None
+        # Reshape: 21 values -> 7 days * 3 features, then denormalize
+        with _stage("inverse_transform", timings):
+            prediction_denorm = self.scaler.inverse_transform(prediction.reshape(-1, 3)).reshape(
+                batch_size, 7, 3
+            )
 
+        return [_format_days(rows) for rows in prediction_denorm]
 
-def get_predictor() -> WeatherPredictor:
-    """Get or create predictor instance"""
-    global _predictor_instance
-    if _predictor_instance is None:
-        _predictor_instance = WeatherPredictor()
-    return _predictor_instance
 
+def _format_days(prediction_denorm: np.ndarray) -> List[dict]:
+    results = []
+    for day in range(7):
+        results.append(
+            {
+                "day": day + 1,
+                "temperature_c": round(float(prediction_denorm[day][0]), 2),
+                "humidity": round(float(prediction_denorm[day][1]), 2),
+                "precipitation_mm": round(float(max(0, prediction_denorm[day][2])), 2),
+            }
+        )
+    return results
+
+
+# Loaded predictors by version, least recently used first. The previous
+# version stays loaded after a switch so batches already dispatched to it
+# can finish.
+_predictors: "OrderedDict[str, WeatherPredictor]" = OrderedDict()
+_predictor_lock = threading.Lock()
+_MAX_LOADED_VERSIONS = 2
+
+
+def get_predictor(version: Optional[str] = None) -> WeatherPredictor:
+    """Get or create the predictor for a version (default: active); each version loads only once"""
+    version = version or active_version()
+    with _predictor_lock:
+        predictor = _predictors.get(version)
+        if predictor is not None:
+            _predictors.move_to_end(version)
+            return predictor
+        predictor = WeatherPredictor(get_artifacts(version))
+        _predictors[version] = predictor
+        while len(_predictors) > _MAX_LOADED_VERSIONS:
+            _predictors.popitem(last=False)
+    return predictor
+
+
+def run_predict_batch(
+    version: str, inputs: Sequence[PredictorInput]
+) -> Tuple[List[List[dict]], StageTimings]:
+    """
+    Executor entry point: predict with this process's predictor instance.
+    Stage timings are returned rather than recorded, so they reach the API
+    process's /metrics even when this runs in a worker process.
+    """
+    timings: StageTimings = []
+    return get_predictor(version).predict_batch(inputs, timings), timings
+
+
+def run_warm_up(version: str, batches: int) -> None:
+    """Executor entry point: load a model version and run a few dummy batches"""
+    predictor = get_predictor(version)
+    for batch in range(batches):
+        predictor.predict_batch([(15.0, 60.0, 0.0)] * (2 ** batch))
@@ -0,0 +1,158 @@
+"""
+Versioned model registry
+
+Each version lives in its own directory under ML_REGISTRY_PATH:
+
+    registry/
+        ACTIVE                      # name of the active version
+        2024-06-01-a1b2c3/
+            manifest.json           # {"version", "created_at", "model", "numpy_weights", "scaler", ...}
+            weather_lstm.pt
+            weather_lstm.npz
+            scaler.pkl
+
+Without a registry the legacy ML_MODEL_PATH / ML_SCALER_PATH pair is served
+under a version derived from the artifacts' content hash.
+"""
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.core.config import settings
+
+MANIFEST_FILE = "manifest.json"
+ACTIVE_FILE = "ACTIVE"
+
+
+class ModelNotFoundError(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class ModelArtifacts:
+    version: str
+    model_path: Path
+    numpy_weights_path: Path
+    scaler_path: Path
+    metadata: Dict[str, Any] = field(default_factory=dict, compare=False, hash=False)
+
+    def weights_path(self, backend: str) -> Path:
+        return self.numpy_weights_path if backend == "numpy" else self.model_path
+
+
+def resolve_artifact(configured_path: str) -> Path:
+    """Resolve an artifact path relative to the backend dir, falling back to the CWD"""
+    base_path = Path(__file__).parent.parent.parent
+    path = (base_path / configured_path.lstrip("../")).resolve()
+    if not path.exists():
+        path = Path(configured_path).resolve()
+    return path
+
+
+def registry_root() -> Optional[Path]:
+    if not settings.ml_registry_path:
+        return None
+    root = resolve_artifact(settings.ml_registry_path)
+    return root if root.is_dir() else None
+
+
+def _read_manifest(version_dir: Path) -> ModelArtifacts:
+    manifest = json.loads((version_dir / MANIFEST_FILE).read_text())
+    return ModelArtifacts(
+        version=manifest.get("version", version_dir.name),
+        model_path=version_dir / manifest.get("model", "weather_lstm.pt"),
+        numpy_weights_path=version_dir / manifest.get("numpy_weights", "weather_lstm.npz"),
+        scaler_path=version_dir / manifest.get("scaler", "scaler.pkl"),
+        metadata=manifest,
+    )
+
+
+def list_versions() -> List[ModelArtifacts]:
+    root = registry_root()
+    if root is None:
+        return []
+    return sorted(
+        (_read_manifest(path) for path in root.iterdir() if (path / MANIFEST_FILE).is_file()),
+        key=lambda artifacts: str(artifacts.metadata.get("created_at", artifacts.version)),
+    )
+
+
+_legacy_versions: Dict[Tuple, str] = {}
+
+
+def _legacy_artifacts() -> ModelArtifacts:
+    model_path = resolve_artifact(settings.ml_model_path)
+    numpy_weights_path = resolve_artifact(settings.ml_numpy_weights_path)
+    scaler_path = resolve_artifact(settings.ml_scaler_path)
+    paths = [model_path if settings.ml_backend == "torch" else numpy_weights_path, scaler_path]
+    stamp = tuple((str(path), path.stat().st_mtime_ns if path.exists() else None) for path in paths)
+    if stamp not in _legacy_versions:
+        digest = hashlib.sha256()
+        for path in paths:
+            if path.exists():
+                digest.update(path.read_bytes())
+        _legacy_versions[stamp] = digest.hexdigest()[:12]
+    return ModelArtifacts(_legacy_versions[stamp], model_path, numpy_weights_path, scaler_path)
+
+
+def get_artifacts(version: str) -> ModelArtifacts:
+    root = registry_root()
+    if root is None:
+        legacy = _legacy_artifacts()
+        if legacy.version == version:
+            return legacy
+        raise ModelNotFoundError(f"Model version '{version}' not found")
+    version_dir = root / version
+    if not (version_dir / MANIFEST_FILE).is_file():
+        raise ModelNotFoundError(f"Model version '{version}' not found")
+    return _read_manifest(version_dir)
+
+
+def _read_active_version() -> str:
+    root = registry_root()
+    if root is None:
+        return _legacy_artifacts().version
+    try:
+        return (root / ACTIVE_FILE).read_text().strip()
+    except FileNotFoundError:
+        versions = list_versions()
+        if not versions:
+            return _legacy_artifacts().version
+        return versions[-1].version
+
+
+# (monotonic time of the last check, version)
+_active_cache: Tuple[float, Optional[str]] = (0.0, None)
+
+
+def active_version() -> str:
+    """
+    The version new predictions should use. The registry is re-checked at most
+    every ML_REGISTRY_POLL_SECONDS, so every worker sharing it follows a switch
+    within that interval; a switch made in this process applies immediately.
+    """
+    global _active_cache
+    checked_at, version = _active_cache
+    now = time.monotonic()
+    if version is None or now - checked_at >= settings.ml_registry_poll_seconds:
+        version = _read_active_version()
+        _active_cache = (now, version)
+    return version
+
+
+def set_active_version(version: str) -> ModelArtifacts:
+    """Atomically point ACTIVE at ``version`` (write to a temp file, then rename)"""
+    global _active_cache
+    root = registry_root()
+    if root is None:
+        raise ModelNotFoundError("No model registry configured")
+    artifacts = get_artifacts(version)
+    tmp_path = root / f".{ACTIVE_FILE}.tmp"
+    tmp_path.write_text(version)
+    os.replace(tmp_path, root / ACTIVE_FILE)
+    _active_cache = (time.monotonic(), version)
+    return artifacts
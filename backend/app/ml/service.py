@@ -0,0 +1,268 @@
+"""
+Async entry point for weather predictions used by the API routes
+"""
+import asyncio
+import sys
+from dataclasses import asdict
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from loguru import logger
+
+from app.core.config import settings
+from app.core.metrics import observe_stage, timed
+from app.ml.batcher import MicroBatcher
+from app.ml.executor import InferenceExecutor, InferenceOverloaded
+from app.ml.predictor import run_predict_batch, run_warm_up
+from app.ml.registry import active_version, get_artifacts, set_active_version
+from app.services.cache import CacheState, TTLCache
+
+DailyInput = Tuple[float, float, float]
+# 14 daily (temperature, humidity, precipitation) rows, oldest first
+PredictionInput = Tuple[DailyInput, ...]
+VersionedInput = Tuple[str, PredictionInput]
+Buckets = Tuple[int, ...]
+ForecastKey = Tuple[str, Buckets]
+
+
+class Forecast(NamedTuple):
+    model_version: str
+    days: List[dict]
+
+
+_batcher: Optional[MicroBatcher[VersionedInput, List[dict]]] = None
+_executor: Optional[InferenceExecutor] = None
+_pending = 0
+_warm_up_task: Optional[asyncio.Task] = None
+_ready = False
+_warm_up_error: Optional[str] = None
+
+# Forecasts are a pure function of (model, inputs), so entries never expire
+_forecast_cache: TTLCache[ForecastKey, List[dict]] = TTLCache(
+    max_entries=settings.ml_forecast_cache_max_entries,
+    ttl_seconds=float("inf"),
+)
+
+
+def _resolutions() -> DailyInput:
+    return (
+        settings.ml_forecast_temp_resolution,
+        settings.ml_forecast_humidity_resolution,
+        settings.ml_forecast_precip_resolution,
+    )
+
+
+def _quantize(inputs: PredictionInput) -> Buckets:
+    """Flatten a history into one bucket index per value"""
+    resolutions = _resolutions()
+    return tuple(
+        round(value / resolution) for day in inputs for value, resolution in zip(day, resolutions)
+    )
+
+
+def _dequantize(buckets: Buckets) -> PredictionInput:
+    resolutions = _resolutions()
+    return tuple(
+        tuple(bucket * resolution for bucket, resolution in zip(buckets[start:start + 3], resolutions))
+        for start in range(0, len(buckets), 3)
+    )
+
+
+def _forecast_entry_bytes(forecast: List[dict]) -> int:
+    return sys.getsizeof(forecast) + sum(
+        sys.getsizeof(day) + sum(sys.getsizeof(value) for value in day.values()) for day in forecast
+    )
+
+
+def get_forecast_cache_stats() -> dict:
+    stats = _forecast_cache.stats()
+    # Every entry has the same shape, so size one and scale
+    sample = next(_forecast_cache.values(), None)
+    approx_bytes = _forecast_entry_bytes(sample) * stats.size if sample is not None else 0
+    return {**asdict(stats), "hit_rate": round(stats.hit_rate, 4), "approx_bytes": approx_bytes}
+
+
+def get_pending_requests() -> int:
+    return _pending
+
+
+def get_executor() -> InferenceExecutor:
+    global _executor
+    if _executor is None:
+        _executor = InferenceExecutor(
+            kind=settings.ml_executor,
+            max_workers=settings.ml_executor_workers,
+            num_threads=settings.ml_torch_threads,
+        )
+    return _executor
+
+
+async def _run_batch(items: List[VersionedInput]) -> List[List[dict]]:
+    # A batch straddling a model switch is split into one forward pass per version
+    by_version: Dict[str, List[int]] = {}
+    for index, (version, _) in enumerate(items):
+        by_version.setdefault(version, []).append(index)
+
+    results: List[Optional[List[dict]]] = [None] * len(items)
+    for version, indices in by_version.items():
+        with timed("inference_batch"):
+            outputs, timings = await get_executor().run(
+                run_predict_batch, version, [items[i][1] for i in indices]
+            )
+        for stage, seconds in timings:
+            observe_stage(stage, seconds)
+        for index, output in zip(indices, outputs):
+            results[index] = output
+    return results
+
+
+def get_batcher() -> MicroBatcher[VersionedInput, List[dict]]:
+    global _batcher
+    if _batcher is None:
+        _batcher = MicroBatcher(
+            _run_batch,
+            max_batch_size=settings.ml_batch_max_size,
+            max_latency_ms=settings.ml_batch_max_latency_ms,
+            # One batch per executor worker keeps every worker busy
+            max_concurrency=get_executor().max_workers,
+        )
+    return _batcher
+
+
+async def predict_weather(history: PredictionInput) -> Forecast:
+    """
+    Predict the next 7 days from a 14 day history with the active model
+    version, batched with concurrent requests when enabled. Histories are
+    quantized and memoized per model version when the forecast cache is on.
+    Raises InferenceOverloaded once ML_MAX_PENDING_REQUESTS are in flight.
+    """
+    version = active_version()
+    if not settings.ml_forecast_cache_enabled:
+        return Forecast(version, await _predict(version, history))
+
+    buckets = _quantize(history)
+    key = (version, buckets)
+    cached, state = _forecast_cache.lookup(key)
+    if state is CacheState.FRESH:
+        return Forecast(version, cached)
+
+    # Predict on the bucket's representative so an entry doesn't depend on
+    # which request happened to populate it
+    days = await _predict(version, _dequantize(buckets))
+    _forecast_cache.set(key, days)
+    return Forecast(version, days)
+
+
+async def predict_weather_many(inputs: List[PredictionInput]) -> List[Forecast]:
+    """
+    Predict for many histories with one forward pass, bypassing the
+    micro-batcher. Cached and duplicate histories are only computed once.
+    Raises InferenceOverloaded when the misses would push other in-flight
+    work past ML_MAX_PENDING_REQUESTS.
+    """
+    global _pending
+    version = active_version()
+    use_cache = settings.ml_forecast_cache_enabled
+    results: List[Optional[List[dict]]] = [None] * len(inputs)
+    misses: Dict[Tuple, List[int]] = {}
+    for index, item in enumerate(inputs):
+        if not use_cache:
+            misses.setdefault((index,), []).append(index)
+            continue
+        buckets = _quantize(item)
+        cached, state = _forecast_cache.lookup((version, buckets))
+        if state is CacheState.FRESH:
+            results[index] = cached
+        else:
+            misses.setdefault(buckets, []).append(index)
+
+    if misses:
+        # A batch larger than the limit is still admitted on an idle service,
+        # otherwise it could never run however often it was retried
+        if _pending and _pending + len(misses) > settings.ml_max_pending_requests:
+            raise InferenceOverloaded(retry_after=settings.ml_retry_after_seconds)
+        keys = list(misses)
+        batch = [
+            (version, _dequantize(key) if use_cache else inputs[key[0]])
+            for key in keys
+        ]
+        _pending += len(batch)
+        try:
+            outputs = await _run_batch(batch)
+        finally:
+            _pending -= len(batch)
+        for key, days in zip(keys, outputs):
+            if use_cache:
+                _forecast_cache.set((version, key), days)
+            for index in misses[key]:
+                results[index] = days
+
+    return [Forecast(version, days) for days in results]
+
+
+async def _predict(version: str, inputs: PredictionInput) -> List[dict]:
+    global _pending
+    if _pending >= settings.ml_max_pending_requests:
+        raise InferenceOverloaded(retry_after=settings.ml_retry_after_seconds)
+
+    _pending += 1
+    try:
+        if not settings.ml_batching_enabled:
+            return (await _run_batch([(version, inputs)]))[0]
+        return await get_batcher().submit((version, inputs))
+    finally:
+        _pending -= 1
+
+
+def readiness() -> Tuple[bool, Optional[str]]:
+    """Whether the model is loaded and warm, and the warm-up error if it failed"""
+    return _ready, _warm_up_error
+
+
+async def load_version(version: str) -> None:
+    """Load ``version`` in every executor worker and run a few dummy batches"""
+    await get_executor().run_on_each_worker(run_warm_up, version, settings.ml_warmup_batches)
+
+
+async def activate_version(version: str) -> None:
+    """
+    Switch new predictions to ``version`` without a cold start: the version is
+    loaded and warmed first, then the registry's ACTIVE pointer is flipped.
+    Requests already batched keep running on the version they started with.
+    """
+    get_artifacts(version)
+    await load_version(version)
+    set_active_version(version)
+    logger.info("Activated model version {}", version)
+
+
+async def warm_up() -> None:
+    """Load the active model in every executor worker and run a few dummy batches"""
+    global _ready, _warm_up_error
+    try:
+        await load_version(active_version())
+    except Exception as exc:
+        _warm_up_error = str(exc)
+        logger.error("Model warm-up failed: {}", exc)
+        return
+    _ready = True
+    logger.info("Model loaded and warmed up")
+
+
+async def start_inference() -> None:
+    global _warm_up_task, _ready
+    get_executor().start()
+    if settings.ml_batching_enabled:
+        get_batcher().start()
+    if settings.ml_warmup_enabled:
+        _warm_up_task = asyncio.create_task(warm_up())
+    else:
+        _ready = True
+
+
+async def stop_inference() -> None:
+    if _warm_up_task is not None and not _warm_up_task.done():
+        _warm_up_task.cancel()
+    if _batcher is not None:
+        await _batcher.stop()
+    if _executor is not None:
+        _executor.shutdown()
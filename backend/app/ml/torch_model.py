@@ -0,0 +1,50 @@
+"""
+PyTorch inference backend for the weather LSTM
+"""
+from pathlib import Path
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+
+class WeatherLSTM(nn.Module):
+    """LSTM model for weather prediction"""
+
+    def __init__(self, input_size=3, hidden_size=64, num_layers=2, output_size=21):
+        super(WeatherLSTM, self).__init__()
+        self.hidden_size = hidden_size
+        self.num_layers = num_layers
+
+        self.lstm = nn.LSTM(
+            input_size, hidden_size, num_layers, batch_first=True, dropout=0.2 if num_layers > 1 else 0.0
+        )
+        self.fc = nn.Linear(hidden_size, output_size)
+
+    def forward(self, x):
+        lstm_out, _ = self.lstm(x)
+        last_output = lstm_out[:, -1, :]
+        output = self.fc(last_output)
+        return output
+
+
+class TorchWeatherModel:
+    """Runs a trained WeatherLSTM state dict on numpy batches"""
+
+    def __init__(self, model_path: Path):
+        self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+        state_dict = torch.load(model_path, map_location=self.device)
+        # Size the network from the weights, so any swept architecture loads
+        hidden_size = state_dict["lstm.weight_hh_l0"].shape[1]
+        num_layers = sum(1 for key in state_dict if key.startswith("lstm.weight_ih_l"))
+        self.model = WeatherLSTM(input_size=3, hidden_size=hidden_size, num_layers=num_layers, output_size=21)
+        self.model.load_state_dict(state_dict)
+        self.model.eval()
+        self.model = self.model.to(self.device)
+
+    def predict(self, sequences: np.ndarray) -> np.ndarray:
+        """Map scaled (B, 14, 3) sequences to scaled (B, 21) outputs"""
+        sequence_tensor = torch.FloatTensor(sequences).to(self.device)
+        with torch.no_grad():
+            prediction = self.model(sequence_tensor)
+        return prediction.cpu().numpy()
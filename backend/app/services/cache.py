@@ -0,0 +1,121 @@
+"""
+In-process TTL cache with LRU eviction and a stale-while-revalidate window
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Generic, Hashable, Iterator, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class CacheState(str, Enum):
+    FRESH = "fresh"
+    STALE = "stale"
+    MISS = "miss"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stale_hits: int = 0
+    evictions: int = 0
+    size: int = 0
+    max_entries: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.stale_hits + self.misses
+        return (self.hits + self.stale_hits) / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Bounded mapping whose entries are fresh for ``ttl_seconds`` and may then be
+    served as stale for another ``stale_seconds`` while the caller refreshes them.
+    Least recently used entries are evicted once ``max_entries`` is reached.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: float,
+        stale_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.stale_seconds = stale_seconds
+        self._clock = clock
+        self._entries: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        self._stats = CacheStats(max_entries=max_entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: K) -> Tuple[Optional[V], CacheState]:
+        """Return the cached value and whether it is fresh, stale or missing"""
+        entry = self._entries.get(key)
+        if entry is None:
+            self._stats.misses += 1
+            return None, CacheState.MISS
+
+        stored_at, value = entry
+        age = self._clock() - stored_at
+        if age < self.ttl_seconds:
+            self._entries.move_to_end(key)
+            self._stats.hits += 1
+            return value, CacheState.FRESH
+        if age < self.ttl_seconds + self.stale_seconds:
+            self._entries.move_to_end(key)
+            self._stats.stale_hits += 1
+            return value, CacheState.STALE
+
+        # Expired entries stay until evicted so get_any can still fall back to them
+        self._stats.misses += 1
+        return None, CacheState.MISS
+
+    def get_any(self, key: K) -> Optional[V]:
+        """Return the value regardless of age, without touching counters"""
+        entry = self._entries.get(key)
+        return entry[1] if entry is not None else None
+
+    def set(self, key: K, value: V, age: float = 0.0) -> None:
+        """Store a value; ``age`` backdates it when it was produced elsewhere earlier"""
+        self._entries[key] = (self._clock() - age, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._stats.evictions += 1
+
+    def values(self) -> Iterator[V]:
+        """Iterate cached values without touching recency or counters"""
+        return (value for _, value in self._entries.values())
+
+    def invalidate(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def discard_if(self, predicate: Callable[[V], bool]) -> int:
+        """Drop every entry whose value matches ``predicate``; returns how many"""
+        keys = [key for key, (_, value) in self._entries.items() if predicate(value)]
+        for key in keys:
+            del self._entries[key]
+        return len(keys)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._stats.hits,
+            misses=self._stats.misses,
+            stale_hits=self._stats.stale_hits,
+            evictions=self._stats.evictions,
+            size=len(self._entries),
+            max_entries=self.max_entries,
+        )
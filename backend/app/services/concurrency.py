@@ -0,0 +1,64 @@
+"""
+Bounded concurrent mapping that yields results as they complete
+"""
+import asyncio
+from collections import deque
+from typing import AsyncIterator, Awaitable, Callable, Iterable, Set, Tuple, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def bounded_map(
+    items: Iterable[T],
+    fn: Callable[[T], Awaitable[R]],
+    concurrency: int,
+    ordered: bool = False,
+) -> AsyncIterator[Tuple[int, R]]:
+    """
+    Apply ``fn`` to ``items`` with at most ``concurrency`` calls in flight and
+    yield ``(index, result)`` pairs. Unordered mode yields in completion
+    order; ordered mode yields in input order. Either way at most
+    ``concurrency`` results are held at once. ``fn`` should return errors
+    rather than raise them; an exception aborts the iteration. Closing the
+    iterator early cancels the outstanding calls.
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    source = iter(enumerate(items))
+    queued: deque[asyncio.Task] = deque()
+    running: Set[asyncio.Task] = set()
+
+    def launch() -> bool:
+        try:
+            index, item = next(source)
+        except StopIteration:
+            return False
+
+        async def call() -> Tuple[int, R]:
+            return index, await fn(item)
+
+        task = asyncio.ensure_future(call())
+        if ordered:
+            queued.append(task)
+        running.add(task)
+        return True
+
+    try:
+        while len(running) < concurrency and launch():
+            pass
+        while running:
+            if ordered:
+                task = queued.popleft()
+                await asyncio.wait([task])
+                done = [task]
+            else:
+                finished, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                done = list(finished)
+            for task in done:
+                running.discard(task)
+                launch()
+                yield task.result()
+    finally:
+        for task in running:
+            task.cancel()
@@ -0,0 +1,153 @@
+"""
+Background precomputation of forecasts for the most requested cities
+"""
+import asyncio
+import heapq
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from app.core.config import settings
+from app.db.schemas import WeatherResponse
+from app.ml.executor import InferenceOverloaded
+from app.ml.registry import active_version
+from app.ml.service import Forecast, predict_weather_many
+from app.services.observations import get_histories
+from app.services.weather_client import WeatherClientError, fetch_current_weather_many, normalize_city
+
+
+_MAX_WEIGHT_EXPONENT = 40
+
+
+class DecayingCounter:
+    """
+    Per-key request counts that halve every ``half_life_seconds``. Instead of
+    decaying every count on each tick, new hits are weighted by a growing
+    factor and scores are rescaled only when that factor gets large. When more
+    than ``max_keys`` are tracked the lowest-scoring half is dropped.
+    """
+
+    def __init__(self, half_life_seconds: float, max_keys: int, clock: Callable[[], float] = time.monotonic):
+        self.half_life_seconds = half_life_seconds
+        self.max_keys = max_keys
+        self._clock = clock
+        self._origin = clock()
+        self._scores: Dict[str, float] = {}
+
+    def _weight(self) -> float:
+        """
+        Weight of a hit made now. Once it would exceed 2 ** 40 the scores are
+        rescaled to the current time instead, so it never overflows however
+        long the counter has been idle.
+        """
+        now = self._clock()
+        exponent = (now - self._origin) / self.half_life_seconds
+        if exponent <= _MAX_WEIGHT_EXPONENT:
+            return 2.0 ** exponent
+        # 2 ** -exponent underflows to 0.0 rather than raising
+        decay = 2.0 ** -exponent
+        self._scores = {key: score * decay for key, score in self._scores.items()}
+        self._origin = now
+        return 1.0
+
+    def add(self, key: str) -> None:
+        self._scores[key] = self._scores.get(key, 0.0) + self._weight()
+        if len(self._scores) > self.max_keys:
+            keep = heapq.nlargest(self.max_keys // 2, self._scores.items(), key=lambda item: item[1])
+            self._scores = dict(keep)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._scores
+
+    def top(self, k: int) -> List[Tuple[str, float]]:
+        """The ``k`` highest keys with their decayed counts as of now"""
+        weight = self._weight()
+        return [
+            (key, score / weight)
+            for key, score in heapq.nlargest(k, self._scores.items(), key=lambda item: item[1])
+        ]
+
+
+_counter = DecayingCounter(settings.hot_cities_half_life_seconds, settings.hot_cities_max_tracked)
+_display_names: Dict[str, str] = {}
+_precomputed: Dict[str, Tuple[float, WeatherResponse, Forecast]] = {}
+_refresh_task: Optional[asyncio.Task] = None
+
+
+def record_request(city: str) -> None:
+    key = normalize_city(city)
+    _counter.add(key)
+    _display_names.setdefault(key, city)
+
+
+def get_precomputed(city: str) -> Optional[Tuple[WeatherResponse, Forecast]]:
+    """A precomputed (weather, forecast) pair if still fresh and made by the active model"""
+    entry = _precomputed.get(normalize_city(city))
+    if entry is None:
+        return None
+    expires_at, weather, forecast = entry
+    if time.monotonic() >= expires_at or forecast.model_version != active_version():
+        return None
+    return weather, forecast
+
+
+async def refresh_hot_cities() -> int:
+    """Fetch current weather for the top cities and predict them in one batch"""
+    global _precomputed
+    keys = [key for key, _ in _counter.top(settings.hot_cities_top_k)]
+    if not keys:
+        return 0
+    cities = [_display_names.get(key, key) for key in keys]
+    # Goes through the weather cache, so this costs at most one upstream call per city per TTL
+    weather = await fetch_current_weather_many(cities, settings.batch_fetch_concurrency)
+    fetched = [(key, w) for key, w in zip(keys, weather) if not isinstance(w, WeatherClientError)]
+    histories = await get_histories([key for key, _ in fetched], [w for _, w in fetched])
+    forecasts = await predict_weather_many(histories)
+
+    expires_at = time.monotonic() + 2 * settings.hot_cities_refresh_interval_seconds
+    _precomputed = {key: (expires_at, w, forecast) for (key, w), forecast in zip(fetched, forecasts)}
+    # Forget display names for cities that fell out of the tracked set
+    for key in [key for key in _display_names if key not in _counter]:
+        del _display_names[key]
+    return len(_precomputed)
+
+
+async def _refresh_loop() -> None:
+    while True:
+        await asyncio.sleep(settings.hot_cities_refresh_interval_seconds)
+        try:
+            count = await refresh_hot_cities()
+            logger.info("Precomputed forecasts for {} hot cities", count)
+        except (WeatherClientError, InferenceOverloaded) as exc:
+            logger.warning("Hot city refresh failed: {}", exc)
+        except Exception as exc:
+            logger.error("Hot city refresh failed: {}", exc)
+
+
+def get_hot_cities_snapshot() -> dict:
+    return {
+        "enabled": settings.hot_cities_enabled,
+        "precomputed": len(_precomputed),
+        "top": [
+            {"city": _display_names.get(key, key), "score": round(score, 3)}
+            for key, score in _counter.top(settings.hot_cities_top_k)
+        ],
+    }
+
+
+async def start_hot_cities() -> None:
+    global _refresh_task
+    if settings.hot_cities_enabled and _refresh_task is None:
+        _refresh_task = asyncio.create_task(_refresh_loop())
+
+
+async def stop_hot_cities() -> None:
+    global _refresh_task
+    if _refresh_task is not None:
+        _refresh_task.cancel()
+        try:
+            await _refresh_task
+        except asyncio.CancelledError:
+            pass
+        _refresh_task = None
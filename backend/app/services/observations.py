@@ -0,0 +1,218 @@
+"""
+Per-city history of upstream observations, aggregated by UTC day
+
+Each city keeps a fixed-size ring buffer of daily running sums in memory,
+backed by the weather_observations table so history survives restarts and
+is shared by all workers. Upstream fetches append to it and predictions
+read the last 14 days from it as the model's input sequence. A worker's
+in-memory copy only picks up other workers' observations when it reloads
+the city (after eviction or a restart).
+"""
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+from sqlalchemy import delete, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.db.models import WeatherObservation
+from app.db.schemas import WeatherResponse
+from app.db.session import AsyncSessionLocal, engine
+from app.ml.predictor import SEQUENCE_LENGTH
+
+# (temperature, humidity, precipitation) per day, oldest first
+History = Tuple[Tuple[float, float, float], ...]
+
+_DAY, _TEMP, _HUMIDITY, _PRECIP, _COUNT = range(5)
+
+
+class DailyRingBuffer:
+    """
+    Running sums for the last ``capacity`` days, one row per day. Day ``d``
+    always lives in row ``d % capacity``, so appending is O(1) and reading a
+    window of ``n`` days is O(n); a row holding an older day is simply reused.
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._rows = np.zeros((capacity, 5))
+        self._rows[:, _DAY] = -1
+
+    def add(self, day: int, temperature: float, humidity: float, precipitation: float, count: int = 1) -> None:
+        row = self._rows[day % self.capacity]
+        if row[_DAY] > day:
+            return  # older than the window
+        if row[_DAY] != day:
+            row[:] = (day, 0.0, 0.0, 0.0, 0)
+        row[_TEMP] += temperature
+        row[_HUMIDITY] += humidity
+        row[_PRECIP] += precipitation
+        row[_COUNT] += count
+
+    def day_means(self, day: int) -> Optional[Tuple[float, float, float]]:
+        row = self._rows[day % self.capacity]
+        if row[_DAY] != day or row[_COUNT] == 0:
+            return None
+        count = row[_COUNT]
+        # Observations carry last-hour precipitation; scale the mean rate to a daily total
+        return (float(row[_TEMP] / count), float(row[_HUMIDITY] / count), float(row[_PRECIP] / count * 24))
+
+    def window(self, end_day: int, length: int) -> List[Optional[Tuple[float, float, float]]]:
+        return [self.day_means(day) for day in range(end_day - length + 1, end_day + 1)]
+
+
+# city key -> ring buffer, least recently used first
+_histories: "OrderedDict[str, DailyRingBuffer]" = OrderedDict()
+_prune_task: Optional[asyncio.Task] = None
+
+
+def _observation(weather: WeatherResponse) -> Tuple[float, float, float]:
+    metrics = weather.metrics
+    return (metrics.temperature_c, metrics.humidity, metrics.precipitation_mm)
+
+
+async def _buffer(key: str) -> DailyRingBuffer:
+    """The city's ring buffer, loaded from the database on first use"""
+    buffer = _histories.get(key)
+    if buffer is not None:
+        _histories.move_to_end(key)
+        return buffer
+
+    loaded = DailyRingBuffer(settings.observation_history_days)
+    since = datetime.utcnow().date() - timedelta(days=settings.observation_history_days)
+    try:
+        async with AsyncSessionLocal() as session:
+            rows = await session.execute(
+                select(WeatherObservation).where(
+                    WeatherObservation.city_key == key, WeatherObservation.day > since
+                )
+            )
+            for row in rows.scalars():
+                loaded.add(
+                    row.day.toordinal(), row.temperature_sum, row.humidity_sum, row.precipitation_sum, row.count
+                )
+    except SQLAlchemyError as exc:
+        logger.warning("Observation history read failed: {}", exc)
+
+    # Another coroutine may have loaded the city while we were reading
+    buffer = _histories.setdefault(key, loaded)
+    while len(_histories) > settings.observation_max_cities:
+        _histories.popitem(last=False)
+    return buffer
+
+
+def _upsert(values: dict):
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        statement = sqlite.insert(WeatherObservation).values(**values)
+    elif dialect == "postgresql":
+        statement = postgresql.insert(WeatherObservation).values(**values)
+    else:
+        return None
+    sums = ("temperature_sum", "humidity_sum", "precipitation_sum", "count")
+    update = {column: getattr(WeatherObservation, column) + getattr(statement.excluded, column) for column in sums}
+    return statement.on_conflict_do_update(index_elements=["city_key", "day"], set_=update)
+
+
+async def record(key: str, weather: WeatherResponse) -> None:
+    """Add one upstream observation to the city's history"""
+    day = weather.fetched_at.date()
+    temperature, humidity, precipitation = _observation(weather)
+    buffer = await _buffer(key)
+    buffer.add(day.toordinal(), temperature, humidity, precipitation)
+
+    values = {
+        "city_key": key,
+        "day": day,
+        "temperature_sum": temperature,
+        "humidity_sum": humidity,
+        "precipitation_sum": precipitation,
+        "count": 1,
+    }
+    try:
+        async with AsyncSessionLocal() as session:
+            statement = _upsert(values)
+            if statement is not None:
+                await session.execute(statement)
+            else:
+                existing = await session.get(WeatherObservation, (key, day))
+                if existing is None:
+                    session.add(WeatherObservation(**values))
+                else:
+                    existing.temperature_sum += temperature
+                    existing.humidity_sum += humidity
+                    existing.precipitation_sum += precipitation
+                    existing.count += 1
+            await session.commit()
+    except SQLAlchemyError as exc:
+        logger.warning("Observation history write failed: {}", exc)
+
+
+async def get_history(key: str, current: WeatherResponse) -> History:
+    """
+    The 14 daily (temperature, humidity, precipitation) means ending on the
+    day of ``current``. The final day falls back to ``current`` when it has
+    no observations yet. Earlier days without observations repeat the
+    previous day; days before the first observation repeat the first one,
+    so a city seen for the first time gets ``current`` repeated 14 times.
+    """
+    fallback = _observation(current)
+    if not settings.observation_store_enabled:
+        return (fallback,) * SEQUENCE_LENGTH
+
+    buffer = await _buffer(key)
+    days = buffer.window(current.fetched_at.date().toordinal(), SEQUENCE_LENGTH)
+    if days[-1] is None:
+        days[-1] = fallback
+    previous = next(day for day in days if day is not None)
+    history = []
+    for day in days:
+        previous = day if day is not None else previous
+        history.append(previous)
+    return tuple(history)
+
+
+async def get_histories(keys: Sequence[str], weather: Sequence[WeatherResponse]) -> List[History]:
+    return [await get_history(key, current) for key, current in zip(keys, weather)]
+
+
+async def prune() -> int:
+    """Delete daily rows older than the history window; returns how many"""
+    cutoff = datetime.utcnow().date() - timedelta(days=settings.observation_history_days)
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(delete(WeatherObservation).where(WeatherObservation.day <= cutoff))
+        await session.commit()
+    return result.rowcount or 0
+
+
+async def _prune_loop() -> None:
+    while True:
+        await asyncio.sleep(settings.observation_prune_interval_seconds)
+        try:
+            removed = await prune()
+            if removed:
+                logger.info("Pruned {} old weather observation rows", removed)
+        except SQLAlchemyError as exc:
+            logger.warning("Observation history pruning failed: {}", exc)
+
+
+async def start_pruning() -> None:
+    global _prune_task
+    if settings.observation_store_enabled and _prune_task is None:
+        _prune_task = asyncio.create_task(_prune_loop())
+
+
+async def stop_pruning() -> None:
+    global _prune_task
+    if _prune_task is not None:
+        _prune_task.cancel()
+        try:
+            await _prune_task
+        except asyncio.CancelledError:
+            pass
+        _prune_task = None
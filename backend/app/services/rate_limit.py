@@ -0,0 +1,79 @@
+"""
+Client-side token buckets for upstream API quotas
+"""
+import asyncio
+import time
+from typing import Callable, Dict
+
+
+class TokenBucket:
+    """Holds up to ``capacity`` tokens, refilled continuously at ``refill_per_second``"""
+
+    def __init__(self, capacity: float, refill_per_second: float, clock: Callable[[], float] = time.monotonic):
+        self.capacity = capacity
+        self.refill_per_second = refill_per_second
+        self._clock = clock
+        self._tokens = capacity
+        self._updated_at = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.refill_per_second)
+        self._updated_at = now
+
+    @property
+    def remaining(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def seconds_until_available(self) -> float:
+        self._refill()
+        if self._tokens >= 1:
+            return 0.0
+        return (1 - self._tokens) / self.refill_per_second
+
+    def consume(self) -> None:
+        self._refill()
+        self._tokens -= 1
+
+
+class RateLimiter:
+    """
+    Takes one token from every bucket per call, so a call is admitted only
+    when all budgets (e.g. per-minute and per-day) allow it. Callers queue for
+    at most ``max_wait`` seconds before giving up.
+    """
+
+    def __init__(self, buckets: Dict[str, TokenBucket], clock: Callable[[], float] = time.monotonic):
+        self.buckets = buckets
+        self._clock = clock
+        self.admitted = 0
+        self.rejected = 0
+
+    async def acquire(self, max_wait: float) -> bool:
+        deadline = self._clock() + max_wait
+        while True:
+            wait = max(bucket.seconds_until_available() for bucket in self.buckets.values())
+            if wait == 0:
+                for bucket in self.buckets.values():
+                    bucket.consume()
+                self.admitted += 1
+                return True
+            if self._clock() + wait > deadline:
+                self.rejected += 1
+                return False
+            await asyncio.sleep(wait)
+
+    def snapshot(self) -> dict:
+        return {
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "buckets": {
+                name: {
+                    "capacity": bucket.capacity,
+                    "remaining": round(bucket.remaining, 2),
+                    "refill_per_second": bucket.refill_per_second,
+                }
+                for name, bucket in self.buckets.items()
+            },
+        }
@@ -0,0 +1,95 @@
+"""
+Retry with jittered exponential backoff and a circuit breaker for upstream calls
+"""
+import asyncio
+import random
+import time
+from enum import Enum
+from typing import Awaitable, Callable, TypeVar
+
+R = TypeVar("R")
+
+
+async def retry_async(
+    fn: Callable[[], Awaitable[R]],
+    attempts: int,
+    base_delay: float,
+    max_delay: float,
+    should_retry: Callable[[Exception], bool],
+) -> R:
+    """
+    Call ``fn`` up to ``attempts`` times, sleeping a random ("full jitter")
+    delay in [0, min(max_delay, base_delay * 2**n)] between attempts. Only
+    exceptions accepted by ``should_retry`` are retried.
+    """
+    for attempt in range(attempts):
+        try:
+            return await fn()
+        except Exception as exc:
+            if attempt == attempts - 1 or not should_retry(exc):
+                raise
+            await asyncio.sleep(random.uniform(0, min(max_delay, base_delay * 2**attempt)))
+    raise ValueError("attempts must be at least 1")
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Opens after ``failure_threshold`` consecutive failures and rejects calls for
+    ``reset_timeout`` seconds. It then lets a single probe through (half-open):
+    success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.rejected = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+
+    def allow_request(self) -> bool:
+        if self.state is CircuitState.OPEN and self._clock() - self._opened_at >= self.reset_timeout:
+            self.state = CircuitState.HALF_OPEN
+        if self.state is CircuitState.CLOSED:
+            return True
+        if self.state is CircuitState.HALF_OPEN and not self._probe_in_flight:
+            self._probe_in_flight = True
+            return True
+        self.rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        self.consecutive_failures += 1
+        self._probe_in_flight = False
+        if self.state is CircuitState.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            self.state = CircuitState.OPEN
+            self._opened_at = self._clock()
+
+    def release(self) -> None:
+        """End an admitted call that says nothing about upstream health"""
+        self._probe_in_flight = False
+
+    def snapshot(self) -> dict:
+        retry_in = 0.0
+        if self.state is CircuitState.OPEN:
+            retry_in = max(0.0, self.reset_timeout - (self._clock() - self._opened_at))
+        return {
+            "state": self.state.value,
+            "consecutive_failures": self.consecutive_failures,
+            "failure_threshold": self.failure_threshold,
+            "rejected": self.rejected,
+            "retry_in_seconds": round(retry_in, 2),
+        }
@@ -0,0 +1,101 @@
+"""
+Current-weather cache tier stored in the app database
+
+Rows are shared by every worker using the same database, so one upstream
+fetch serves all of them and survives restarts.
+"""
+import asyncio
+from datetime import datetime, timedelta
+
+from loguru import logger
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.config import settings
+from app.db.models import WeatherCacheEntry
+from app.db.schemas import WeatherResponse
+from app.db.session import AsyncSessionLocal, engine
+
+_compaction_task: asyncio.Task | None = None
+
+
+async def read(city_key: str, allow_expired: bool = False) -> WeatherResponse | None:
+    """Return the stored response for a city, or None if missing or expired"""
+    try:
+        async with AsyncSessionLocal() as session:
+            entry = await session.get(WeatherCacheEntry, city_key)
+    except SQLAlchemyError as exc:
+        logger.warning("Shared weather cache read failed: {}", exc)
+        return None
+    if entry is None or (not allow_expired and entry.expires_at <= datetime.utcnow()):
+        return None
+    return WeatherResponse.model_validate_json(entry.payload)
+
+
+def _upsert(values: dict):
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        statement = sqlite.insert(WeatherCacheEntry).values(**values)
+    elif dialect == "postgresql":
+        statement = postgresql.insert(WeatherCacheEntry).values(**values)
+    else:
+        return None
+    update = {key: value for key, value in values.items() if key != "city_key"}
+    return statement.on_conflict_do_update(index_elements=["city_key"], set_=update)
+
+
+async def write(city_key: str, weather: WeatherResponse) -> None:
+    values = {
+        "city_key": city_key,
+        "payload": weather.model_dump_json(),
+        "fetched_at": weather.fetched_at,
+        "expires_at": weather.fetched_at + timedelta(seconds=settings.weather_cache_ttl_seconds),
+    }
+    try:
+        async with AsyncSessionLocal() as session:
+            statement = _upsert(values)
+            if statement is not None:
+                await session.execute(statement)
+            else:
+                await session.merge(WeatherCacheEntry(**values))
+            await session.commit()
+    except SQLAlchemyError as exc:
+        logger.warning("Shared weather cache write failed: {}", exc)
+
+
+async def compact() -> int:
+    """Delete rows past their TTL and stale window; returns how many"""
+    cutoff = datetime.utcnow() - timedelta(seconds=settings.weather_cache_stale_seconds)
+    async with AsyncSessionLocal() as session:
+        result = await session.execute(delete(WeatherCacheEntry).where(WeatherCacheEntry.expires_at < cutoff))
+        await session.commit()
+    return result.rowcount or 0
+
+
+async def _compaction_loop() -> None:
+    while True:
+        await asyncio.sleep(settings.weather_cache_db_compaction_interval_seconds)
+        try:
+            removed = await compact()
+            if removed:
+                logger.info("Compacted {} expired weather cache rows", removed)
+        except SQLAlchemyError as exc:
+            logger.warning("Weather cache compaction failed: {}", exc)
+
+
+async def start_compaction() -> None:
+    global _compaction_task
+    if settings.weather_cache_db_enabled and _compaction_task is None:
+        _compaction_task = asyncio.create_task(_compaction_loop())
+
+
+async def stop_compaction() -> None:
+    global _compaction_task
+    if _compaction_task is not None:
+        _compaction_task.cancel()
+        try:
+            await _compaction_task
+        except asyncio.CancelledError:
+            pass
+        _compaction_task = None
@@ -0,0 +1,40 @@
+"""
+Request coalescing: concurrent calls for the same key share one in-flight result
+"""
+import asyncio
+from typing import Awaitable, Callable, Dict, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class SingleFlight(Generic[K, V]):
+    """
+    Run at most one ``fn()`` per key at a time. Callers arriving while a call is
+    in flight await the same task and receive its result or exception.
+    """
+
+    def __init__(self):
+        self._inflight: Dict[K, asyncio.Task] = {}
+        self.coalesced = 0
+
+    def in_flight(self, key: K) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: K, fn: Callable[[], Awaitable[V]]) -> V:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self.coalesced += 1
+        # Shield so one cancelled caller doesn't cancel the call for everyone else
+        return await asyncio.shield(task)
+
+    def _forget(self, key: K, task: asyncio.Task) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved even if every caller went away
+            task.exception()
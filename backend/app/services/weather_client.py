@@ -1,20 +1,230 @@
+import asyncio
 from datetime import datetime
 
 import httpx
 from loguru import logger
 
 from app.core.config import settings
+from app.core.metrics import timed
 from app.db.schemas import WeatherResponse, WeatherMetrics
+from app.services import observations, shared_cache
+from app.services.cache import CacheState, CacheStats, TTLCache
+from app.services.rate_limit import RateLimiter, TokenBucket
+from app.services.resilience import CircuitBreaker, retry_async
+from app.services.singleflight import SingleFlight
 
 
 class WeatherClientError(Exception):
     pass
 
 
-OPENWEATHER_BASE_URL = "https://api.openweathermap.org/data/2.5/weather"
+class UpstreamUnavailable(WeatherClientError):
+    """OpenWeather can't be called right now; cached data may be served instead"""
+
+
+class RateLimitExceeded(UpstreamUnavailable):
+    pass
+
+
+class CircuitOpenError(UpstreamUnavailable):
+    pass
+
+
+# Upstream statuses worth retrying; 429 means our quota is spent, so it only
+# counts against the circuit breaker
+RETRYABLE_STATUS_CODES = {500, 502, 503, 504}
+
+
+_weather_cache: TTLCache[str, WeatherResponse] = TTLCache(
+    max_entries=settings.weather_cache_max_entries,
+    ttl_seconds=settings.weather_cache_ttl_seconds,
+    stale_seconds=settings.weather_cache_stale_seconds,
+)
+_refresh_tasks: dict[str, asyncio.Task] = {}
+_upstream_calls: SingleFlight[str, WeatherResponse] = SingleFlight()
+_http_client: httpx.AsyncClient | None = None
+_rate_limiter = RateLimiter(
+    {
+        "minute": TokenBucket(settings.openweather_calls_per_minute, settings.openweather_calls_per_minute / 60),
+        "day": TokenBucket(settings.openweather_calls_per_day, settings.openweather_calls_per_day / 86400),
+    }
+)
+
+_circuit_breaker = CircuitBreaker(
+    failure_threshold=settings.openweather_circuit_failure_threshold,
+    reset_timeout=settings.openweather_circuit_reset_seconds,
+)
+
+
+def get_rate_limit_snapshot() -> dict:
+    return {"enabled": settings.openweather_rate_limit_enabled, **_rate_limiter.snapshot()}
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        http2=settings.http2_enabled,
+        limits=httpx.Limits(
+            max_connections=settings.http_max_connections,
+            max_keepalive_connections=settings.http_max_keepalive_connections,
+            keepalive_expiry=settings.http_keepalive_expiry_seconds,
+        ),
+        timeout=httpx.Timeout(
+            connect=settings.http_connect_timeout_seconds,
+            read=settings.http_read_timeout_seconds,
+            write=settings.http_write_timeout_seconds,
+            pool=settings.http_pool_timeout_seconds,
+        ),
+    )
+
+
+async def start_http_client() -> None:
+    """Open the pooled client shared by all upstream calls (called from lifespan)"""
+    global _http_client
+    if _http_client is None:
+        _http_client = _build_http_client()
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared client, creating it lazily outside the app lifespan"""
+    global _http_client
+    if _http_client is None:
+        _http_client = _build_http_client()
+    return _http_client
+
+
+def normalize_city(city: str) -> str:
+    """Cache key for a city name: case-folded with whitespace collapsed"""
+    return " ".join(city.split()).casefold()
+
+
+def get_circuit_snapshot() -> dict:
+    return _circuit_breaker.snapshot()
+
+
+def get_weather_cache_stats() -> CacheStats:
+    return _weather_cache.stats()
+
+
+def get_coalesced_request_count() -> int:
+    return _upstream_calls.coalesced
 
 
 async def fetch_current_weather(city: str) -> WeatherResponse:
+    """
+    Fetch current weather, served from the in-process cache when possible.
+    Stale entries are returned immediately while a single background task
+    refreshes them from OpenWeather. Concurrent misses for the same city
+    share one upstream call. When OpenWeather can't be called (budget
+    exhausted, circuit open, repeated transient failures) any cached entry
+    for the city is served regardless of age.
+    """
+    key = normalize_city(city)
+    if not settings.weather_cache_enabled:
+        return await _upstream_calls.do(key, lambda: _fetch_and_record(key, city))
+
+    cached, state = _weather_cache.lookup(key)
+    if state is CacheState.FRESH:
+        return cached
+    if state is CacheState.STALE:
+        _schedule_refresh(key, city)
+        return cached
+
+    try:
+        return await _upstream_calls.do(key, lambda: _load(key, city))
+    except UpstreamUnavailable as exc:
+        fallback = _weather_cache.get_any(key)
+        if fallback is None and settings.weather_cache_db_enabled:
+            fallback = await shared_cache.read(key, allow_expired=True)
+        if fallback is None:
+            raise
+        logger.warning("Serving expired data for '{}': {}", city, exc)
+        return fallback
+
+
+async def fetch_current_weather_many(
+    cities: list[str], concurrency: int
+) -> list[WeatherResponse | WeatherClientError]:
+    """
+    Fetch several cities concurrently, at most ``concurrency`` at a time.
+    Per-city failures are returned in place instead of raised.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch_one(city: str) -> WeatherResponse | WeatherClientError:
+        async with semaphore:
+            try:
+                return await fetch_current_weather(city)
+            except WeatherClientError as exc:
+                return exc
+
+    return await asyncio.gather(*(fetch_one(city) for city in cities))
+
+
+async def _load(key: str, city: str) -> WeatherResponse:
+    if settings.weather_cache_db_enabled:
+        shared = await shared_cache.read(key)
+        if shared is not None:
+            # Keep the original fetch time so the entry doesn't outlive its TTL
+            age = (datetime.utcnow() - shared.fetched_at).total_seconds()
+            _weather_cache.set(key, shared, age=max(age, 0.0))
+            return shared
+
+    weather = await _fetch_and_record(key, city)
+    _weather_cache.set(key, weather)
+    if settings.weather_cache_db_enabled:
+        await shared_cache.write(key, weather)
+    return weather
+
+
+async def _fetch_and_record(key: str, city: str) -> WeatherResponse:
+    weather = await _fetch_from_openweather(city)
+    if settings.observation_store_enabled:
+        await observations.record(key, weather)
+    return weather
+
+
+def _schedule_refresh(key: str, city: str) -> None:
+    if key in _refresh_tasks or _upstream_calls.in_flight(key):
+        return
+    task = asyncio.create_task(_refresh(key, city))
+    _refresh_tasks[key] = task
+    task.add_done_callback(lambda _: _refresh_tasks.pop(key, None))
+
+
+async def _refresh(key: str, city: str) -> None:
+    try:
+        await _upstream_calls.do(key, lambda: _load(key, city))
+    except WeatherClientError as exc:
+        logger.warning("Background refresh for '{}' failed: {}", city, exc)
+
+
+def _is_transient(exc: Exception) -> bool:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code in RETRYABLE_STATUS_CODES
+    return isinstance(exc, httpx.TransportError)
+
+
+async def _get_openweather(params: dict) -> httpx.Response:
+    """One upstream attempt; every attempt, including retries, spends budget"""
+    if settings.openweather_rate_limit_enabled and not await _rate_limiter.acquire(
+        settings.openweather_rate_limit_wait_seconds
+    ):
+        raise RateLimitExceeded("OpenWeather call budget exhausted, try again later")
+
+    with timed("upstream_fetch"):
+        response = await get_http_client().get(settings.openweather_base_url, params=params)
+    response.raise_for_status()
+    return response
+
+
+async def _fetch_from_openweather(city: str) -> WeatherResponse:
     """
     Fetch current weather using OpenWeather API.
     """
@@ -28,32 +238,57 @@ async def fetch_current_weather(city: str) -> WeatherResponse:
         "units": "metric",
     }
 
-    async with httpx.AsyncClient(timeout=15) as client:
+    if not _circuit_breaker.allow_request():
+        raise CircuitOpenError("OpenWeather is unavailable, try again later")
+
+    try:
+        response = await retry_async(
+            lambda: _get_openweather(params),
+            attempts=settings.openweather_retry_attempts,
+            base_delay=settings.openweather_retry_base_delay_seconds,
+            max_delay=settings.openweather_retry_max_delay_seconds,
+            should_retry=_is_transient,
+        )
+    except RateLimitExceeded:
+        _circuit_breaker.release()
+        raise
+    except httpx.HTTPStatusError as exc:
+        status_code = exc.response.status_code
+        if status_code in RETRYABLE_STATUS_CODES or status_code == 429:
+            _circuit_breaker.record_failure()
+        else:
+            _circuit_breaker.record_success()
+
+        detail = "Unable to fetch weather data"
         try:
-            response = await client.get(OPENWEATHER_BASE_URL, params=params)
-            response.raise_for_status()
-        except httpx.HTTPStatusError as exc:
-            detail = "Unable to fetch weather data"
-            try:
-                error_payload = exc.response.json()
-                detail = error_payload.get("message", detail)
-            except ValueError:
-                pass
+            error_payload = exc.response.json()
+            detail = error_payload.get("message", detail)
+        except ValueError:
+            pass
 
-            if exc.response.status_code == 404:
-                raise WeatherClientError(f"City '{city}' not found") from exc
+        if status_code == 404:
+            raise WeatherClientError(f"City '{city}' not found") from exc
 
-            logger.error("OpenWeather HTTP error: %s", detail)
-            raise WeatherClientError(detail) from exc
-        except httpx.HTTPError as exc:
-            logger.error("OpenWeather request error: %s", str(exc))
-            raise WeatherClientError("Network error calling OpenWeather") from exc
+        logger.error("OpenWeather HTTP error: %s", detail)
+        if status_code == 429:
+            # Upstream quota spent (e.g. shared by several workers); cached data may still be served
+            raise RateLimitExceeded(detail) from exc
+        if status_code in RETRYABLE_STATUS_CODES:
+            raise UpstreamUnavailable(detail) from exc
+        raise WeatherClientError(detail) from exc
+    except httpx.HTTPError as exc:
+        _circuit_breaker.record_failure()
+        logger.error("OpenWeather request error: %s", str(exc))
+        raise UpstreamUnavailable("Network error calling OpenWeather") from exc
+    _circuit_breaker.record_success()
 
     data = response.json()
     weather_info = (data.get("weather") or [{}])[0]
     main_info = data.get("main") or {}
     wind_info = data.get("wind") or {}
     sys_info = data.get("sys") or {}
+    rain_info = data.get("rain") or {}
+    snow_info = data.get("snow") or {}
 
     description = weather_info.get("description", "Unknown").title()
     icon = weather_info.get("icon", "01d")
@@ -62,6 +297,7 @@ async def fetch_current_weather(city: str) -> WeatherResponse:
         temperature_c=main_info.get("temp", 0.0),
         humidity=main_info.get("humidity", 0.0),
         wind_speed=wind_info.get("speed", 0.0),
+        precipitation_mm=rain_info.get("1h", 0.0) + snow_info.get("1h", 0.0),
         description=description,
         icon=icon,
     )
@@ -0,0 +1,93 @@
+"""
+Login storm benchmark: login throughput and latency of unrelated endpoints.
+
+Usage: python scripts/benchmark_auth.py [--logins 200] [--concurrency 50] [--workers 4]
+
+Runs the app in-process against a throwaway SQLite database, fires
+``--logins`` concurrent logins and meanwhile polls GET /health. Pass
+``--workers 0`` to hash on the event loop (the previous behaviour) for
+comparison.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def run(args):
+    import httpx
+
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with app.router.lifespan_context(app), httpx.AsyncClient(
+        transport=transport, base_url="http://bench"
+    ) as client:
+        await client.post(
+            "/auth/signup", json={"email": "bench@example.com", "password": "benchpassword"}
+        )
+
+        login_latencies, health_latencies = [], []
+        slots = asyncio.Semaphore(args.concurrency)
+        done = asyncio.Event()
+
+        async def login():
+            async with slots:
+                start = time.perf_counter()
+                response = await client.post(
+                    "/auth/login", data={"username": "bench@example.com", "password": "benchpassword"}
+                )
+                response.raise_for_status()
+                login_latencies.append(time.perf_counter() - start)
+
+        async def poll_health():
+            while not done.is_set():
+                start = time.perf_counter()
+                await client.get("/health")
+                health_latencies.append(time.perf_counter() - start)
+                await asyncio.sleep(0.01)
+
+        poller = asyncio.create_task(poll_health())
+        start = time.perf_counter()
+        await asyncio.gather(*(login() for _ in range(args.logins)))
+        elapsed = time.perf_counter() - start
+        done.set()
+        await poller
+
+    print(f"hash workers:        {args.workers}")
+    print(f"logins/s:            {args.logins / elapsed:.1f}")
+    print(f"login p50/p99 ms:    {statistics.median(login_latencies) * 1000:.0f} / "
+          f"{percentile(login_latencies, 99) * 1000:.0f}")
+    print(f"/health samples:     {len(health_latencies)}")
+    print(f"/health p50/p99 ms:  {statistics.median(health_latencies) * 1000:.1f} / "
+          f"{percentile(health_latencies, 99) * 1000:.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    db_dir = tempfile.mkdtemp()
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{db_dir}/bench.db"
+    os.environ["PASSWORD_HASH_WORKERS"] = str(args.workers)
+    os.environ["ML_WARMUP_ENABLED"] = "false"
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Measure prediction throughput against batch size.
+
+Usage: python scripts/benchmark_batching.py [--requests 512]
+
+Reports two tables: direct WeatherPredictor.predict_batch calls at fixed batch
+sizes, and concurrent requests pushed through the MicroBatcher with different
+max_batch_size settings.
+"""
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.ml.batcher import MicroBatcher
+from app.ml.predictor import get_predictor
+
+BATCH_SIZES = [1, 2, 4, 8, 16, 32, 64, 128]
+
+
+def random_inputs(n):
+    return [
+        (random.uniform(-10, 35), random.uniform(20, 100), random.uniform(0, 10))
+        for _ in range(n)
+    ]
+
+
+def bench_direct(predictor, total):
+    print("Direct predict_batch")
+    print(f"{'batch':>6} {'items/s':>10} {'ms/batch':>10}")
+    for batch_size in BATCH_SIZES:
+        inputs = random_inputs(batch_size)
+        batches = max(1, total // batch_size)
+        predictor.predict_batch(inputs)  # warm-up
+        start = time.perf_counter()
+        for _ in range(batches):
+            predictor.predict_batch(inputs)
+        elapsed = time.perf_counter() - start
+        print(f"{batch_size:>6} {batches * batch_size / elapsed:>10.1f} {elapsed / batches * 1000:>10.3f}")
+
+
+async def bench_batcher(predictor, total, max_latency_ms):
+    print(f"\nMicroBatcher, {total} concurrent requests, max latency {max_latency_ms} ms")
+    print(f"{'max':>6} {'items/s':>10} {'mean batch':>11}")
+
+    async def process(items):
+        return predictor.predict_batch(items)
+
+    for max_batch_size in BATCH_SIZES:
+        batcher = MicroBatcher(process, max_batch_size=max_batch_size, max_latency_ms=max_latency_ms)
+        inputs = random_inputs(total)
+        start = time.perf_counter()
+        await asyncio.gather(*(batcher.submit(item) for item in inputs))
+        elapsed = time.perf_counter() - start
+        await batcher.stop()
+        print(f"{max_batch_size:>6} {total / elapsed:>10.1f} {batcher.stats.mean_batch_size:>11.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=512)
+    parser.add_argument("--max-latency-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    predictor = get_predictor()
+    bench_direct(predictor, args.requests)
+    asyncio.run(bench_batcher(predictor, args.requests, args.max_latency_ms))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+"""
+Load-test /api/current and /api/predict against the local OpenWeather stub.
+
+Usage: python scripts/benchmark_load.py [--concurrency 1 8 32 64] [--requests 500] [--no-cache]
+
+Starts scripts/openweather_stub.py and the API under uvicorn (fresh SQLite
+database, OpenWeather quota disabled), signs up a benchmark user, then drives
+each endpoint with a fixed number of closed-loop workers per concurrency
+level. Cities are drawn from the stub's list with a fixed seed, so two runs
+issue the same request sequence. Reports throughput, p50/p95/p99 latency,
+error count and the API process RSS after each level.
+
+--no-cache turns off the weather and forecast caches so every request goes
+through the upstream fetch and the model.
+"""
+import argparse
+import asyncio
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import httpx
+
+BACKEND_DIR = Path(__file__).parent.parent
+sys.path.append(str(BACKEND_DIR))
+
+from scripts.openweather_stub import KNOWN_CITIES
+
+ENDPOINTS = {
+    "current": "/api/current",
+    "predict": "/api/predict",
+}
+
+
+def percentile(sorted_values, q):
+    if not sorted_values:
+        return float("nan")
+    index = min(len(sorted_values) - 1, max(0, round(q / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+def rss_mb(pid):
+    try:
+        with open(f"/proc/{pid}/status") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return float("nan")
+
+
+def start_servers(args, workdir):
+    stub = subprocess.Popen(
+        [
+            sys.executable,
+            str(BACKEND_DIR / "scripts" / "openweather_stub.py"),
+            "--port", str(args.stub_port),
+            "--latency-ms", str(args.stub_latency_ms),
+            "--error-rate", str(args.stub_error_rate),
+        ],
+    )
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite+aiosqlite:///{workdir}/benchmark.db",
+        "OPENWEATHER_API_KEY": "stub",
+        "OPENWEATHER_BASE_URL": f"http://127.0.0.1:{args.stub_port}/data/2.5/weather",
+        "OPENWEATHER_RATE_LIMIT_ENABLED": "false",
+        "BCRYPT_ROUNDS": "4",
+    }
+    if args.no_cache:
+        env.update(
+            WEATHER_CACHE_ENABLED="false",
+            ML_FORECAST_CACHE_ENABLED="false",
+            AUTH_CACHE_ENABLED="false",
+        )
+    api = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "app.main:app",
+            "--port", str(args.port),
+            "--log-level", "warning",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    return stub, api
+
+
+async def wait_until_ready(client, timeout=60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            if (await client.get("/ready")).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        await asyncio.sleep(0.25)
+    raise RuntimeError("API did not become ready")
+
+
+async def login(client):
+    credentials = {"email": "bench@example.com", "password": "benchmark-password"}
+    await client.post("/auth/signup", json={**credentials, "full_name": "Benchmark"})
+    response = await client.post(
+        "/auth/login",
+        data={"username": credentials["email"], "password": credentials["password"]},
+    )
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def run_level(client, path, headers, cities, concurrency):
+    queue = iter(cities)
+    latencies = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for city in queue:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path, params={"city": city}, headers=headers)
+                ok = response.status_code == 200
+            except httpx.HTTPError:
+                ok = False
+            latencies.append(time.perf_counter() - start)
+            errors += not ok
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return time.perf_counter() - start, sorted(latencies), errors
+
+
+async def bench(args, api_pid):
+    limits = httpx.Limits(max_connections=max(args.concurrency), max_keepalive_connections=max(args.concurrency))
+    async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{args.port}", limits=limits, timeout=30) as client:
+        await wait_until_ready(client)
+        headers = await login(client)
+
+        print(f"{'endpoint':>8} {'conc':>5} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7} {'rss MB':>7}")
+        for name in args.endpoints:
+            for concurrency in args.concurrency:
+                rng = random.Random(args.seed)
+                cities = [rng.choice(KNOWN_CITIES) for _ in range(args.requests)]
+                elapsed, latencies, errors = await run_level(
+                    client, ENDPOINTS[name], headers, cities, concurrency
+                )
+                print(
+                    f"{name:>8} {concurrency:>5} {len(latencies) / elapsed:>9.1f} "
+                    f"{percentile(latencies, 50) * 1000:>8.1f} {percentile(latencies, 95) * 1000:>8.1f} "
+                    f"{percentile(latencies, 99) * 1000:>8.1f} {errors:>7} {rss_mb(api_pid):>7.1f}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoints", nargs="+", choices=sorted(ENDPOINTS), default=["current", "predict"])
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--requests", type=int, default=500, help="requests per concurrency level")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--port", type=int, default=8800)
+    parser.add_argument("--stub-port", type=int, default=8900)
+    parser.add_argument("--stub-latency-ms", type=float, default=80.0)
+    parser.add_argument("--stub-error-rate", type=float, default=0.0)
+    parser.add_argument("--no-cache", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        stub, api = start_servers(args, workdir)
+        try:
+            asyncio.run(bench(args, api.pid))
+        finally:
+            for process in (api, stub):
+                process.terminate()
+                process.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+Compare the torch and NumPy inference backends.
+
+Usage: python scripts/benchmark_numpy_backend.py [--batches 200]
+
+Checks that both backends produce the same outputs, then runs each backend in
+a fresh interpreter to report cold start (imports + model load), peak RSS and
+per-batch latency.
+"""
+import argparse
+import json
+import resource
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+BATCH_SIZES = [1, 8, 32, 128]
+PARITY_TOLERANCE = 1e-4
+
+
+def peak_rss_mb():
+    # VmHWM is reset on exec, unlike ru_maxrss which a child inherits from its parent
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(backend, batches):
+    """Runs inside the child interpreter; prints one JSON line"""
+    start = time.perf_counter()
+    import numpy as np
+
+    from app.ml.predictor import WeatherPredictor
+    from app.ml.registry import active_version, get_artifacts
+
+    predictor = WeatherPredictor(get_artifacts(active_version()), backend=backend)
+    predictor.predict(20.0, 60.0, 0.0)
+    cold_start = time.perf_counter() - start
+
+    rng = np.random.default_rng(0)
+    latency_ms = {}
+    for batch_size in BATCH_SIZES:
+        sequences = rng.random((batch_size, 14, 3), dtype=np.float32)
+        predictor.model.predict(sequences)
+        t0 = time.perf_counter()
+        for _ in range(batches):
+            predictor.model.predict(sequences)
+        latency_ms[batch_size] = (time.perf_counter() - t0) / batches * 1000
+
+    print(json.dumps({
+        "cold_start_s": cold_start,
+        "max_rss_mb": peak_rss_mb(),
+        "torch_imported": "torch" in sys.modules,
+        "latency_ms": latency_ms,
+    }))
+
+
+def check_parity():
+    import numpy as np
+
+    from app.ml.predictor import WeatherPredictor
+    from app.ml.registry import active_version, get_artifacts
+
+    artifacts = get_artifacts(active_version())
+    torch_model = WeatherPredictor(artifacts, backend="torch").model
+    numpy_model = WeatherPredictor(artifacts, backend="numpy").model
+    sequences = np.random.default_rng(1).random((256, 14, 3), dtype=np.float32)
+    max_diff = float(np.abs(torch_model.predict(sequences) - numpy_model.predict(sequences)).max())
+    status = "OK" if max_diff < PARITY_TOLERANCE else "MISMATCH"
+    print(f"Parity over 256 sequences: max |torch - numpy| = {max_diff:.2e} ({status})")
+    return max_diff < PARITY_TOLERANCE
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batches", type=int, default=200)
+    parser.add_argument("--child", choices=["torch", "numpy"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        measure(args.child, args.batches)
+        return
+
+    parity_ok = check_parity()
+
+    results = {}
+    for backend in ("torch", "numpy"):
+        output = subprocess.run(
+            [sys.executable, __file__, "--child", backend, "--batches", str(args.batches)],
+            check=True,
+            capture_output=True,
+            text=True,
+        ).stdout
+        results[backend] = json.loads(output.strip().splitlines()[-1])
+
+    print(f"\n{'backend':>8} {'cold start s':>13} {'max RSS MB':>11} {'torch loaded':>13}")
+    for backend, r in results.items():
+        print(f"{backend:>8} {r['cold_start_s']:>13.2f} {r['max_rss_mb']:>11.1f} {str(r['torch_imported']):>13}")
+
+    print(f"\n{'batch':>6} " + " ".join(f"{b + ' ms':>10}" for b in results))
+    for batch_size in BATCH_SIZES:
+        row = " ".join(f"{results[b]['latency_ms'][str(batch_size)]:>10.3f}" for b in results)
+        print(f"{batch_size:>6} {row}")
+
+    sys.exit(0 if parity_ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""
+Export the trained torch checkpoint to the .npz file used by ML_BACKEND=numpy.
+
+Usage: python scripts/export_numpy_weights.py [model.pt] [weights.npz]
+"""
+import sys
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.ml.numpy_model import export_npz
+from app.ml.registry import resolve_artifact
+
+if __name__ == "__main__":
+    model_path = Path(sys.argv[1]) if len(sys.argv) > 1 else resolve_artifact(settings.ml_model_path)
+    npz_path = Path(sys.argv[2]) if len(sys.argv) > 2 else model_path.with_suffix(".npz")
+    export_npz(model_path, npz_path)
+    print(f"Exported {model_path} -> {npz_path}")
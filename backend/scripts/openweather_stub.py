@@ -0,0 +1,93 @@
+"""
+Local stand-in for the OpenWeather current-weather endpoint.
+
+Usage: python scripts/openweather_stub.py [--port 8900] [--latency-ms 80] [--error-rate 0.01]
+
+Point the API at it with OPENWEATHER_BASE_URL=http://127.0.0.1:8900/data/2.5/weather.
+Responses are deterministic per city so runs are comparable; cities outside
+the known list get OpenWeather's 404 payload, and --error-rate of requests
+fail with a 503 (seeded, so the failure pattern repeats across runs).
+"""
+import argparse
+import asyncio
+import hashlib
+import random
+
+import uvicorn
+from fastapi import FastAPI, Query
+from fastapi.responses import JSONResponse
+
+KNOWN_CITIES = [
+    "London", "Paris", "Berlin", "Madrid", "Rome", "Vienna", "Prague", "Warsaw",
+    "Lisbon", "Dublin", "Amsterdam", "Brussels", "Oslo", "Stockholm", "Helsinki",
+    "Copenhagen", "Athens", "Istanbul", "Cairo", "Nairobi", "Lagos", "Johannesburg",
+    "Dubai", "Mumbai", "Delhi", "Bangalore", "Karachi", "Dhaka", "Bangkok", "Singapore",
+    "Jakarta", "Manila", "Hong Kong", "Shanghai", "Beijing", "Seoul", "Tokyo", "Osaka",
+    "Sydney", "Melbourne", "Auckland", "Honolulu", "Los Angeles", "San Francisco",
+    "Seattle", "Vancouver", "Denver", "Chicago", "Toronto", "New York", "Boston",
+    "Miami", "Mexico City", "Bogota", "Lima", "Santiago", "Buenos Aires", "Sao Paulo",
+    "Rio de Janeiro", "Reykjavik",
+]
+DESCRIPTIONS = [
+    ("clear sky", "01d"),
+    ("few clouds", "02d"),
+    ("scattered clouds", "03d"),
+    ("light rain", "10d"),
+    ("thunderstorm", "11d"),
+    ("snow", "13d"),
+    ("mist", "50d"),
+]
+
+
+def city_payload(name: str) -> dict:
+    """Plausible, stable weather for ``name``"""
+    rng = random.Random(hashlib.sha256(name.lower().encode()).digest())
+    description, icon = rng.choice(DESCRIPTIONS)
+    payload = {
+        "name": name,
+        "sys": {"country": name[:2].upper()},
+        "main": {"temp": round(rng.uniform(-10, 35), 2), "humidity": rng.randint(20, 100)},
+        "wind": {"speed": round(rng.uniform(0, 15), 2)},
+        "weather": [{"description": description, "icon": icon}],
+    }
+    if icon in ("10d", "11d"):
+        payload["rain"] = {"1h": round(rng.uniform(0.1, 5), 2)}
+    return payload
+
+
+def create_app(latency_ms: float, jitter_ms: float, error_rate: float, seed: int) -> FastAPI:
+    app = FastAPI(title="OpenWeather stub")
+    cities = {name.lower(): city_payload(name) for name in KNOWN_CITIES}
+    rng = random.Random(seed)
+
+    @app.get("/data/2.5/weather")
+    async def current_weather(q: str = Query(...), appid: str = Query(...), units: str = "metric"):
+        delay = latency_ms + rng.uniform(-jitter_ms, jitter_ms)
+        if delay > 0:
+            await asyncio.sleep(delay / 1000)
+        if rng.random() < error_rate:
+            return JSONResponse(status_code=503, content={"cod": "503", "message": "stub failure"})
+        payload = cities.get(q.strip().lower())
+        if payload is None:
+            return JSONResponse(status_code=404, content={"cod": "404", "message": "city not found"})
+        return payload
+
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="mean added latency per request")
+    parser.add_argument("--jitter-ms", type=float, default=20.0, help="uniform +/- spread around the latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="fraction of requests answered with 503")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    app = create_app(args.latency_ms, args.jitter_ms, args.error_rate, args.seed)
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
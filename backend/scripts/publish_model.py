@@ -0,0 +1,71 @@
+"""
+Copy trained artifacts into the model registry as a new version.
+
+Usage: python scripts/publish_model.py [--version NAME] [--activate]
+
+Reads ML_MODEL_PATH, ML_NUMPY_WEIGHTS_PATH and ML_SCALER_PATH and writes
+<ML_REGISTRY_PATH>/<version>/ with a manifest.json. Activating from here only
+flips the ACTIVE pointer; use POST /admin/models/{version}/activate on a running
+API to warm the version up before switching.
+"""
+import argparse
+import hashlib
+import json
+import shutil
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add backend directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.core.config import settings
+from app.ml.registry import MANIFEST_FILE, resolve_artifact, set_active_version
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--version", help="Version name (default: timestamp + content hash)")
+    parser.add_argument("--activate", action="store_true", help="Make this the active version")
+    args = parser.parse_args()
+
+    if not settings.ml_registry_path:
+        sys.exit("ML_REGISTRY_PATH is not set")
+
+    sources = {
+        "model": resolve_artifact(settings.ml_model_path),
+        "numpy_weights": resolve_artifact(settings.ml_numpy_weights_path),
+        "scaler": resolve_artifact(settings.ml_scaler_path),
+    }
+    missing = [str(path) for key, path in sources.items() if key != "numpy_weights" and not path.exists()]
+    if missing:
+        sys.exit(f"Missing artifacts: {', '.join(missing)}")
+
+    digest = hashlib.sha256()
+    for path in sources.values():
+        if path.exists():
+            digest.update(path.read_bytes())
+    created_at = datetime.now(timezone.utc)
+    version = args.version or f"{created_at:%Y%m%d-%H%M%S}-{digest.hexdigest()[:8]}"
+
+    registry = resolve_artifact(settings.ml_registry_path)
+    version_dir = registry / version
+    if version_dir.exists():
+        sys.exit(f"Version {version} already exists in {registry}")
+    version_dir.mkdir(parents=True)
+
+    manifest = {"version": version, "created_at": created_at.isoformat(), "sha256": digest.hexdigest()}
+    for key, path in sources.items():
+        if path.exists():
+            shutil.copy2(path, version_dir / path.name)
+            manifest[key] = path.name
+    (version_dir / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+    print(f"Published {version} to {version_dir}")
+
+    if args.activate:
+        set_active_version(version)
+        print(f"Activated {version}")
+
+
+if __name__ == "__main__":
+    main()
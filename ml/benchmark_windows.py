@@ -0,0 +1,63 @@
+"""
+Benchmark sliding-window construction: Python loop vs strided views.
+
+Usage: python benchmark_windows.py [--sizes 1000 10000 100000 1000000]
+
+Reports wall time and peak traced memory (tracemalloc) for building X/y from
+a synthetic (N, 3) scaled feature array, plus the time to read ~10k evenly
+spaced windows through WeatherDataset.
+"""
+import argparse
+import time
+import tracemalloc
+
+import numpy as np
+
+from train_model import WeatherDataset, make_windows
+
+
+def loop_windows(features, sequence_length=14):
+    """The previous list-append implementation, kept for comparison"""
+    X, y = [], []
+    for i in range(len(features) - sequence_length - 6):
+        X.append(features[i : i + sequence_length])
+        y.append(features[i + sequence_length : i + sequence_length + 7].flatten())
+    return np.array(X), np.array(y)
+
+
+def measure(fn, *args):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = fn(*args)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    args = parser.parse_args()
+
+    print(f"{'rows':>10} {'loop s':>9} {'loop MB':>9} {'view s':>9} {'view MB':>9} {'10k reads s':>12}")
+    for size in args.sizes:
+        features = np.random.default_rng(0).random((size, 3), dtype=np.float32)
+        (X_loop, y_loop), loop_time, loop_mb = measure(loop_windows, features)
+        (X, y), view_time, view_mb = measure(make_windows, features)
+        assert np.array_equal(X, X_loop) and np.array_equal(y, y_loop)
+        del X_loop, y_loop
+
+        dataset = WeatherDataset(X, y)
+        start = time.perf_counter()
+        for idx in range(0, len(dataset), max(1, len(dataset) // 10_000)):
+            dataset[idx]
+        iterate_time = time.perf_counter() - start
+
+        print(
+            f"{size:>10} {loop_time:>9.3f} {loop_mb:>9.1f} {view_time:>9.4f} {view_mb:>9.3f} {iterate_time:>12.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,234 @@
+"""
+Hyperparameter sweep for the weather LSTM.
+
+Usage: python sweep.py [--spec sweep.json] [--cores-per-trial 2] [--max-epochs 100] [--patience 10]
+
+The CSV is preprocessed once (see train_model.py). Trials then run in a
+process pool where every worker is pinned to its own disjoint set of CPU
+cores and limits torch to that many threads, so trials don't compete for
+cores. Each trial stops early when validation loss stops improving.
+
+A spec is JSON: {"mode": "grid" | "random", "trials": 20, "params": {...}}.
+Grid mode takes a list of values per parameter. Random mode also accepts
+{"uniform": [low, high]} and {"log_uniform": [low, high]}. Searchable
+parameters are hidden_size, num_layers, dropout, lr and batch_size.
+
+Writes models/sweep/results.csv (one row per trial, best first) and copies
+the best trial's weights plus the shared scaler into the models directory.
+"""
+import argparse
+import itertools
+import json
+import math
+import multiprocessing
+import os
+import pickle
+import random
+import shutil
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import pandas as pd
+import torch
+import torch.nn as nn
+from torch.utils.data import DataLoader
+
+from train_model import (
+    BlockShuffleSampler,
+    MemmapWeatherDataset,
+    WeatherLSTM,
+    prepare_data,
+    save_weights,
+    train_model,
+)
+
+DEFAULT_SPEC = {
+    "mode": "grid",
+    "params": {
+        "hidden_size": [32, 64, 128],
+        "num_layers": [1, 2],
+        "dropout": [0.2],
+        "lr": [0.001, 0.003],
+        "batch_size": [32],
+    },
+}
+DEFAULT_PARAMS = {"hidden_size": 64, "num_layers": 2, "dropout": 0.2, "lr": 0.001, "batch_size": 32}
+
+
+def expand_spec(spec, seed=42):
+    """List of trial parameter dicts for a grid or random search spec"""
+    params = spec["params"]
+    if spec.get("mode", "grid") == "grid":
+        names = list(params)
+        return [
+            {**DEFAULT_PARAMS, **dict(zip(names, values))}
+            for values in itertools.product(*(params[name] for name in names))
+        ]
+
+    rng = random.Random(seed)
+
+    def sample(values):
+        if isinstance(values, list):
+            return rng.choice(values)
+        if "uniform" in values:
+            return rng.uniform(*values["uniform"])
+        if "log_uniform" in values:
+            low, high = values["log_uniform"]
+            return math.exp(rng.uniform(math.log(low), math.log(high)))
+        raise ValueError(f"Unsupported parameter distribution: {values}")
+
+    return [
+        {**DEFAULT_PARAMS, **{name: sample(values) for name, values in params.items()}}
+        for _ in range(spec.get("trials", 10))
+    ]
+
+
+def available_cpus():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def core_groups(workers, cores_per_trial):
+    """Disjoint sets of ``cores_per_trial`` CPUs this process may run on, one per worker"""
+    cpus = available_cpus()
+    if workers * cores_per_trial > len(cpus):
+        raise ValueError(f"{workers} workers x {cores_per_trial} cores need more than the {len(cpus)} available CPUs")
+    return [cpus[i * cores_per_trial : (i + 1) * cores_per_trial] for i in range(workers)]
+
+
+_worker_cores = None
+
+
+def _init_worker(groups):
+    """Pool initializer: claim one core group, pin to it and size torch's thread pools to match"""
+    global _worker_cores
+    _worker_cores = groups.get()
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, _worker_cores)
+    torch.set_num_threads(len(_worker_cores))
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # already fixed once torch has run parallel work
+
+
+def run_trial(trial_id, params, features_path, train_starts_path, val_starts_path, max_epochs, patience, trial_dir):
+    torch.manual_seed(42)
+    start = time.perf_counter()
+
+    train_dataset = MemmapWeatherDataset(features_path, train_starts_path)
+    val_dataset = MemmapWeatherDataset(features_path, val_starts_path)
+    batch_size = int(params["batch_size"])
+    train_loader = DataLoader(train_dataset, batch_size=batch_size, sampler=BlockShuffleSampler(len(train_dataset)))
+    val_loader = DataLoader(val_dataset, batch_size=batch_size, shuffle=False)
+
+    model = WeatherLSTM(
+        hidden_size=int(params["hidden_size"]),
+        num_layers=int(params["num_layers"]),
+        dropout=float(params["dropout"]),
+    )
+    optimizer = torch.optim.Adam(model.parameters(), lr=float(params["lr"]))
+    val_losses = train_model(
+        model,
+        train_loader,
+        nn.MSELoss(),
+        optimizer,
+        num_epochs=max_epochs,
+        val_loader=val_loader,
+        patience=patience or None,
+        log_every=0,
+    )
+
+    trial_dir = Path(trial_dir)
+    trial_dir.mkdir(parents=True, exist_ok=True)
+    save_weights(model, trial_dir / "weather_lstm.pt", trial_dir / "weather_lstm.npz")
+    return {
+        "trial": trial_id,
+        **params,
+        "best_val_loss": min(val_losses),
+        "epochs": len(val_losses),
+        "seconds": round(time.perf_counter() - start, 2),
+        "cores": ",".join(map(str, _worker_cores or [])),
+    }
+
+
+def parse_args():
+    ml_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--spec", type=Path, help="JSON search spec (default: a small built-in grid)")
+    parser.add_argument("--data", type=Path, default=ml_dir / "data" / "sample_weather.csv")
+    parser.add_argument("--models-dir", type=Path, default=ml_dir / "models")
+    parser.add_argument("--chunksize", type=int, default=100_000)
+    parser.add_argument("--cores-per-trial", type=int, default=1)
+    parser.add_argument("--workers", type=int, help="concurrent trials (default: available CPUs / cores per trial)")
+    parser.add_argument("--max-epochs", type=int, default=100)
+    parser.add_argument(
+        "--patience", type=int, default=10, help="stop after this many epochs without validation improvement (0: never)"
+    )
+    parser.add_argument("--seed", type=int, default=42, help="seed for random search")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    spec = json.loads(args.spec.read_text()) if args.spec else DEFAULT_SPEC
+    trials = expand_spec(spec, seed=args.seed)
+
+    sweep_dir = args.models_dir / "sweep"
+    sweep_dir.mkdir(parents=True, exist_ok=True)
+    features_path = sweep_dir / "features.npy"
+
+    print("Preprocessing data...")
+    scaler, train_starts_path, val_starts_path = prepare_data(args.data, features_path, args.chunksize)
+    with open(sweep_dir / "scaler.pkl", "wb") as f:
+        pickle.dump(scaler, f)
+
+    workers = min(args.workers or max(len(available_cpus()) // args.cores_per_trial, 1), len(trials))
+    groups = core_groups(workers, args.cores_per_trial)
+    print(f"Running {len(trials)} trials on {workers} workers x {args.cores_per_trial} cores")
+
+    # Spawned workers start without the parent's torch thread pools
+    context = multiprocessing.get_context("spawn")
+    group_queue = context.Queue()
+    for group in groups:
+        group_queue.put(group)
+
+    results = []
+    with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(group_queue,)) as pool:
+        futures = [
+            pool.submit(
+                run_trial,
+                trial_id,
+                params,
+                str(features_path),
+                str(train_starts_path),
+                str(val_starts_path),
+                args.max_epochs,
+                args.patience,
+                str(sweep_dir / f"trial_{trial_id:03d}"),
+            )
+            for trial_id, params in enumerate(trials)
+        ]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            print(
+                f"Trial {result['trial']:>3}: val loss {result['best_val_loss']:.6f} "
+                f"after {result['epochs']} epochs ({result['seconds']}s)"
+            )
+
+    table = pd.DataFrame(results).sort_values("best_val_loss").reset_index(drop=True)
+    table.to_csv(sweep_dir / "results.csv", index=False)
+    print(table.to_string(index=False))
+
+    best_dir = sweep_dir / f"trial_{int(table.loc[0, 'trial']):03d}"
+    for name in ("weather_lstm.pt", "weather_lstm.npz"):
+        shutil.copy(best_dir / name, args.models_dir / name)
+    shutil.copy(sweep_dir / "scaler.pkl", args.models_dir / "scaler.pkl")
+    print(f"Best trial {int(table.loc[0, 'trial'])} copied to {args.models_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,20 @@
 """
 WeatherWise ML Model Training Script
 Trains an LSTM model for 7-day weather prediction
+
+Usage: python train_model.py [--data data/sample_weather.csv] [--num-workers 2]
+
+The CSV is streamed in chunks into a float32 .npy feature file (scaled with a
+MinMaxScaler fitted incrementally), and training windows are read straight
+from that file through a memory map, so the dataset never has to fit in RAM.
+An optional ``station`` column holds many stations' series in one file;
+windows never cross from one station into the next.
 """
+import argparse
 import os
+import random
 import sys
+import time
 from pathlib import Path
 
 import numpy as np
@@ -11,7 +22,7 @@ import pandas as pd
 import torch
 import torch.nn as nn
 from sklearn.preprocessing import MinMaxScaler
-from torch.utils.data import Dataset, DataLoader
+from torch.utils.data import Dataset, DataLoader, Sampler
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -22,29 +33,117 @@ np.random.seed(42)
 
 
 class WeatherDataset(Dataset):
-    """Dataset for weather time series"""
+    """Dataset for weather time series
+
+    Accepts the strided window views from ``make_windows`` and only copies a
+    single window into a tensor when it is indexed.
+    """
 
     def __init__(self, sequences, targets):
-        self.sequences = torch.FloatTensor(sequences)
-        self.targets = torch.FloatTensor(targets)
+        self.sequences = sequences
+        self.targets = targets
 
     def __len__(self):
         return len(self.sequences)
 
     def __getitem__(self, idx):
-        return self.sequences[idx], self.targets[idx]
+        return torch.tensor(self.sequences[idx]), torch.tensor(self.targets[idx])
+
+
+class MemmapWeatherDataset(Dataset):
+    """Windows read on demand from a (N, F) float32 .npy feature file
+
+    ``starts_path`` is a .npy file of window start rows (see
+    ``build_window_index``). Both files are memory-mapped lazily in each
+    process, so the dataset pickles cheaply to DataLoader workers and every
+    worker gets its own file handles.
+    """
+
+    def __init__(self, features_path, starts_path, sequence_length=14, horizon=7):
+        self.features_path = str(features_path)
+        self.starts_path = str(starts_path)
+        self.sequence_length = sequence_length
+        self.horizon = horizon
+        self._features = None
+        self._starts = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_features"] = None
+        state["_starts"] = None
+        return state
+
+    @property
+    def features(self):
+        if self._features is None:
+            self._features = np.load(self.features_path, mmap_mode="r")
+        return self._features
+
+    @property
+    def starts(self):
+        if self._starts is None:
+            self._starts = np.load(self.starts_path, mmap_mode="r")
+        return self._starts
+
+    def __len__(self):
+        return len(self.starts)
+
+    def __getitem__(self, idx):
+        begin = int(self.starts[idx])
+        end = begin + self.sequence_length
+        # One contiguous read covers the window and its targets
+        rows = np.array(self.features[begin : end + self.horizon])
+        return torch.from_numpy(rows[: self.sequence_length]), torch.from_numpy(
+            rows[self.sequence_length :].reshape(-1)
+        )
+
+
+class BlockShuffleSampler(Sampler):
+    """Shuffled window order that keeps memory-mapped reads local
+
+    Window indices are cut into blocks of ``block_size`` consecutive windows
+    (one station, adjacent days). Block order is shuffled every epoch and
+    each group of ``buffer_blocks`` blocks is shuffled together, so a batch
+    mixes windows from many stations while reads stay within a few regions
+    of the feature file. Memory is O(num_samples / block_size) instead of a
+    full permutation.
+    """
+
+    def __init__(self, num_samples, block_size=256, buffer_blocks=64, seed=42):
+        self.num_samples = num_samples
+        self.block_size = block_size
+        self.buffer_blocks = buffer_blocks
+        self.seed = seed
+        self.epoch = 0
+
+    def __len__(self):
+        return self.num_samples
+
+    def __iter__(self):
+        generator = np.random.default_rng([self.seed, self.epoch])
+        self.epoch += 1
+        num_blocks = -(-self.num_samples // self.block_size)
+        order = generator.permutation(num_blocks)
+        offsets = np.arange(self.block_size)
+        for group in range(0, num_blocks, self.buffer_blocks):
+            blocks = order[group : group + self.buffer_blocks]
+            indices = (blocks[:, None] * self.block_size + offsets).ravel()
+            indices = indices[indices < self.num_samples]
+            generator.shuffle(indices)
+            yield from indices.tolist()
 
 
 class WeatherLSTM(nn.Module):
     """LSTM model for weather prediction"""
 
-    def __init__(self, input_size=3, hidden_size=64, num_layers=2, output_size=21):
+    def __init__(self, input_size=3, hidden_size=64, num_layers=2, output_size=21, dropout=0.2):
         super(WeatherLSTM, self).__init__()
         self.hidden_size = hidden_size
         self.num_layers = num_layers
 
+        # Dropout only applies between stacked layers
         self.lstm = nn.LSTM(
-            input_size, hidden_size, num_layers, batch_first=True, dropout=0.2
+            input_size, hidden_size, num_layers, batch_first=True, dropout=dropout if num_layers > 1 else 0.0
         )
         self.fc = nn.Linear(hidden_size, output_size)
 
@@ -56,36 +155,179 @@ class WeatherLSTM(nn.Module):
         return output
 
 
-def load_and_preprocess_data(data_path: str, sequence_length: int = 14):
-    """Load and preprocess weather data"""
-    df = pd.read_csv(data_path)
-    df["date"] = pd.to_datetime(df["date"])
-    df = df.sort_values("date").reset_index(drop=True)
-
-    # Select features: temp, humidity, precip
-    features = df[["temp_c", "humidity", "precip_mm"]].values
-
-    # Normalize features
+def make_windows(features: np.ndarray, sequence_length: int = 14, horizon: int = 7):
+    """
+    Zero-copy sliding windows over a (N, F) feature array.
+
+    Returns read-only views X of shape (W, sequence_length, F) and y of shape
+    (W, horizon * F), where y[i] is the flattened ``horizon`` rows following
+    X[i]. Because the array is C-contiguous, consecutive rows are adjacent in
+    memory and y can be expressed as a flat view without copying.
+    """
+    features = np.ascontiguousarray(features)
+    num_rows, num_features = features.shape
+    num_windows = max(num_rows - sequence_length - horizon + 1, 0)
+    row_stride, item_stride = features.strides
+
+    X = np.lib.stride_tricks.as_strided(
+        features,
+        shape=(num_windows, sequence_length, num_features),
+        strides=(row_stride, row_stride, item_stride),
+        writeable=False,
+    )
+    y = np.lib.stride_tricks.as_strided(
+        features[sequence_length:],
+        shape=(num_windows, horizon * num_features),
+        strides=(row_stride, item_stride),
+        writeable=False,
+    )
+    return X, y
+
+
+FEATURE_COLUMNS = ["temp_c", "humidity", "precip_mm"]
+# Optional; without it the whole file is one station
+STATION_COLUMN = "station"
+
+
+def _read_chunks(data_path, chunksize, with_station):
+    columns = ["date", *FEATURE_COLUMNS] + ([STATION_COLUMN] if with_station else [])
+    dtype = {column: np.float32 for column in FEATURE_COLUMNS}
+    if with_station:
+        dtype[STATION_COLUMN] = str
+    return pd.read_csv(data_path, usecols=columns, dtype=dtype, parse_dates=["date"], chunksize=chunksize)
+
+
+def preprocess_to_memmap(data_path, features_path, chunksize: int = 100_000):
+    """
+    Stream a CSV into a scaled float32 .npy file.
+
+    The first pass fits the MinMaxScaler with ``partial_fit``, counts rows
+    per station and checks ordering; the second writes each scaled chunk into
+    the memory-mapped output. Only one chunk is held in memory at a time.
+    Each station's rows must be contiguous and sorted by date (a file without
+    a station column must be sorted by date), since a global sort would need
+    the whole file.
+
+    Returns the fitted scaler and the row count of each station, in file order.
+    """
+    with_station = STATION_COLUMN in pd.read_csv(data_path, nrows=0).columns
     scaler = MinMaxScaler()
-    features_scaled = scaler.fit_transform(features)
+    station_rows = []
+    seen_stations = set()
+    last_station = last_date = None
+    for chunk in _read_chunks(data_path, chunksize, with_station):
+        stations = chunk[STATION_COLUMN].to_numpy() if with_station else np.zeros(len(chunk), dtype=np.int8)
+        dates = chunk["date"].to_numpy()
+
+        same_station = stations[1:] == stations[:-1]
+        if (dates[1:][same_station] < dates[:-1][same_station]).any() or (
+            stations[0] == last_station and dates[0] < last_date
+        ):
+            raise ValueError(f"{data_path} must be sorted by date within each station")
+
+        # Run-length encode the chunk's stations, continuing the previous chunk's run
+        run_starts = np.concatenate(([0], np.flatnonzero(~same_station) + 1))
+        run_lengths = np.diff(np.append(run_starts, len(chunk)))
+        for station, length in zip(stations[run_starts], run_lengths):
+            if station == last_station:
+                station_rows[-1] += int(length)
+                continue
+            if station in seen_stations:
+                raise ValueError(f"Rows for station {station!r} in {data_path} must be contiguous")
+            seen_stations.add(station)
+            station_rows.append(int(length))
+            last_station = station
+        last_date = dates[-1]
+
+        scaler.partial_fit(chunk[FEATURE_COLUMNS].to_numpy(dtype=np.float64))
+
+    num_rows = sum(station_rows)
+    features = np.lib.format.open_memmap(
+        features_path, mode="w+", dtype=np.float32, shape=(num_rows, len(FEATURE_COLUMNS))
+    )
+    offset = 0
+    for chunk in _read_chunks(data_path, chunksize, with_station):
+        features[offset : offset + len(chunk)] = scaler.transform(chunk[FEATURE_COLUMNS].to_numpy(dtype=np.float64))
+        offset += len(chunk)
+    features.flush()
+    del features
+
+    return scaler, np.asarray(station_rows, dtype=np.int64)
+
+
+def build_window_index(station_rows, window_length):
+    """
+    Station and start row of every window that stays within one station.
+
+    Station ``s`` owns rows ``offset[s]`` to ``offset[s] + rows[s]`` and
+    contributes ``rows[s] - window_length + 1`` windows. All of them are laid
+    out with one vectorized pass, linear in the number of windows. Windows
+    come out ordered by station, then date.
+    """
+    station_rows = np.asarray(station_rows, dtype=np.int64)
+    offsets = np.cumsum(station_rows) - station_rows
+    counts = np.maximum(station_rows - window_length + 1, 0)
+    first_window = np.cumsum(counts) - counts
+    stations = np.repeat(np.arange(len(station_rows)), counts)
+    starts = np.arange(counts.sum()) - np.repeat(first_window - offsets, counts)
+    return stations, starts
+
+
+def split_windows(stations, train_fraction=0.8):
+    """Mask of training windows: the earliest ``train_fraction`` of each station's windows"""
+    counts = np.bincount(stations)
+    first_window = np.cumsum(counts) - counts
+    position = np.arange(len(stations)) - first_window[stations]
+    return position < np.floor(counts * train_fraction).astype(np.int64)[stations]
+
+
+def evaluate(model, loader, criterion, device="cpu"):
+    """Mean loss over ``loader`` with the model in eval mode"""
+    model.eval()
+    # Accumulate on the device; one sync at the end instead of one per batch
+    total_loss = torch.zeros((), device=device)
+    with torch.no_grad():
+        for sequences, targets in loader:
+            sequences, targets = sequences.to(device), targets.to(device)
+            outputs = model(sequences)
+            total_loss += criterion(outputs, targets)
+    return total_loss.item() / max(len(loader), 1)
 
-    # Create sequences
-    X, y = [], []
-    for i in range(len(features_scaled) - sequence_length - 6):
-        X.append(features_scaled[i : i + sequence_length])
-        # Target: next 7 days (21 values: 7 days * 3 features)
-        y.append(features_scaled[i + sequence_length : i + sequence_length + 7].flatten())
 
-    return np.array(X), np.array(y), scaler
+def new_progress():
+    """Early-stopping state carried across epochs and saved in checkpoints"""
+    return {"val_losses": [], "epoch_seconds": [], "best_loss": float("inf"), "best_state": None, "stale_epochs": 0}
 
 
 def train_model(
-    model, train_loader, criterion, optimizer, num_epochs=50, device="cpu"
+    model,
+    train_loader,
+    criterion,
+    optimizer,
+    num_epochs=50,
+    device="cpu",
+    val_loader=None,
+    patience=None,
+    log_every=10,
+    start_epoch=0,
+    progress=None,
+    on_epoch_end=None,
 ):
-    """Train the LSTM model"""
-    model.train()
-    for epoch in range(num_epochs):
-        total_loss = 0
+    """Train the LSTM model
+
+    With ``val_loader`` the model is validated after every epoch; with
+    ``patience`` as well, training stops once validation loss hasn't improved
+    for that many epochs and the best weights are restored. To resume, pass
+    the ``progress`` saved with a checkpoint and the epoch to continue from.
+    ``on_epoch_end(epoch, progress)`` runs after every epoch, e.g. to save a
+    checkpoint. Returns the per-epoch validation losses (empty without
+    ``val_loader``).
+    """
+    progress = progress or new_progress()
+    for epoch in range(start_epoch, num_epochs):
+        epoch_start = time.perf_counter()
+        model.train()
+        total_loss = torch.zeros((), device=device)
         for sequences, targets in train_loader:
             sequences, targets = sequences.to(device), targets.to(device)
 
@@ -96,43 +338,170 @@ def train_model(
             torch.nn.utils.clip_grad_norm_(model.parameters(), max_norm=1.0)
             optimizer.step()
 
-            total_loss += loss.item()
-
-        if (epoch + 1) % 10 == 0:
-            avg_loss = total_loss / len(train_loader)
-            print(f"Epoch [{epoch+1}/{num_epochs}], Loss: {avg_loss:.6f}")
+            total_loss += loss.detach()
+
+        train_loss = total_loss.item() / max(len(train_loader), 1)
+        val_loss = None
+        if val_loader is not None:
+            val_loss = evaluate(model, val_loader, criterion, device)
+            progress["val_losses"].append(val_loss)
+            if val_loss < progress["best_loss"]:
+                progress["best_loss"], progress["stale_epochs"] = val_loss, 0
+                progress["best_state"] = {key: value.detach().clone() for key, value in model.state_dict().items()}
+            else:
+                progress["stale_epochs"] += 1
+        progress["epoch_seconds"].append(time.perf_counter() - epoch_start)
+
+        if log_every and (epoch + 1) % log_every == 0:
+            message = f"Epoch [{epoch+1}/{num_epochs}], Loss: {train_loss:.6f}"
+            if val_loss is not None:
+                message += f", Val Loss: {val_loss:.6f}"
+            print(f"{message}, {progress['epoch_seconds'][-1]:.2f}s")
+
+        if on_epoch_end is not None:
+            on_epoch_end(epoch, progress)
+        if patience is not None and progress["stale_epochs"] >= patience:
+            if log_every:
+                print(f"Early stopping after epoch {epoch + 1}: no improvement for {patience} epochs")
+            break
+
+    if patience is not None and progress["best_state"] is not None:
+        model.load_state_dict(progress["best_state"])
+    return progress["val_losses"]
+
+
+def save_checkpoint(path, model, optimizer, epoch, progress, scaler, sampler=None):
+    """Everything needed to continue training after ``epoch``; written atomically"""
+    checkpoint = {
+        "model": model.state_dict(),
+        "optimizer": optimizer.state_dict(),
+        "epoch": epoch,
+        "progress": progress,
+        "scaler": scaler,
+        "sampler_epoch": getattr(sampler, "epoch", None),
+        "rng": {
+            "torch": torch.get_rng_state(),
+            "numpy": np.random.get_state(),
+            "python": random.getstate(),
+        },
+    }
+    path = Path(path)
+    tmp_path = path.with_suffix(".tmp")
+    torch.save(checkpoint, tmp_path)
+    os.replace(tmp_path, path)
+
+
+def load_checkpoint(path, model, optimizer, sampler=None):
+    """Restore model, optimizer, sampler and RNG state; returns the checkpoint dict"""
+    # Holds the pickled scaler and RNG states, so it can't be a weights-only load
+    checkpoint = torch.load(path, map_location="cpu", weights_only=False)
+    model.load_state_dict(checkpoint["model"])
+    optimizer.load_state_dict(checkpoint["optimizer"])
+    if sampler is not None and checkpoint["sampler_epoch"] is not None:
+        sampler.epoch = checkpoint["sampler_epoch"]
+    torch.set_rng_state(checkpoint["rng"]["torch"])
+    np.random.set_state(checkpoint["rng"]["numpy"])
+    random.setstate(checkpoint["rng"]["python"])
+    return checkpoint
+
+
+def save_weights(model, model_path, numpy_weights_path):
+    torch.save(model.state_dict(), model_path)
+    # Same weights for the backend's torch-free NumPy inference path
+    np.savez(numpy_weights_path, **{k: v.cpu().numpy() for k, v in model.state_dict().items()})
+
+
+def prepare_data(data_path, features_path, chunksize, sequence_length=14, horizon=7):
+    """
+    Preprocess the CSV into ``features_path`` and save the train/validation
+    window starts next to it. Returns the scaler and both start file paths.
+    """
+    features_path = Path(features_path)
+    scaler, station_rows = preprocess_to_memmap(data_path, features_path, chunksize=chunksize)
+    stations, starts = build_window_index(station_rows, sequence_length + horizon)
+
+    print(
+        f"Dataset: {station_rows.sum()} rows from {len(station_rows)} station(s), "
+        f"{len(starts)} windows in {features_path}"
+    )
+
+    # Split each station's windows in time order (80% train, 20% validation)
+    is_train = split_windows(stations, train_fraction=0.8)
+    train_starts_path = features_path.with_suffix(".train.npy")
+    val_starts_path = features_path.with_suffix(".val.npy")
+    np.save(train_starts_path, starts[is_train])
+    np.save(val_starts_path, starts[~is_train])
+    return scaler, train_starts_path, val_starts_path
+
+
+def parse_args():
+    ml_dir = Path(__file__).parent
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--data", type=Path, default=ml_dir / "data" / "sample_weather.csv")
+    parser.add_argument(
+        "--features",
+        type=Path,
+        help="where to write the scaled .npy feature file (default: next to the CSV)",
+    )
+    parser.add_argument("--models-dir", type=Path, default=ml_dir / "models")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="CSV rows read per chunk")
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--num-workers", type=int, default=0, help="DataLoader worker processes")
+    parser.add_argument(
+        "--shuffle-block-size", type=int, default=256, help="consecutive windows shuffled as one block"
+    )
+    parser.add_argument(
+        "--shuffle-buffer-blocks", type=int, default=64, help="blocks mixed together when shuffling"
+    )
+    parser.add_argument("--epochs", type=int, default=100)
+    parser.add_argument(
+        "--patience", type=int, default=10, help="stop after this many epochs without validation improvement (0: never)"
+    )
+    parser.add_argument("--threads", type=int, help="torch intra-op threads (default: torch's choice)")
+    parser.add_argument("--checkpoint", type=Path, help="checkpoint file (default: <models-dir>/checkpoint.pt)")
+    parser.add_argument("--checkpoint-every", type=int, default=1, help="epochs between checkpoints (0: never)")
+    parser.add_argument("--resume", action="store_true", help="continue from the checkpoint file")
+    return parser.parse_args()
 
 
 def main():
     """Main training function"""
+    args = parse_args()
+    sequence_length, horizon = 14, 7
+
     # Paths
-    data_path = Path(__file__).parent / "data" / "sample_weather.csv"
-    models_dir = Path(__file__).parent / "models"
+    data_path = args.data
+    features_path = args.features or data_path.with_suffix(".features.npy")
+    models_dir = args.models_dir
     models_dir.mkdir(exist_ok=True)
 
     model_path = models_dir / "weather_lstm.pt"
+    numpy_weights_path = models_dir / "weather_lstm.npz"
     scaler_path = models_dir / "scaler.pkl"
 
     print("Loading and preprocessing data...")
-    X, y, scaler = load_and_preprocess_data(str(data_path), sequence_length=14)
-
-    print(f"Dataset shape: X={X.shape}, y={y.shape}")
-
-    # Split data (80% train, 20% validation)
-    split_idx = int(len(X) * 0.8)
-    X_train, X_val = X[:split_idx], X[split_idx:]
-    y_train, y_val = y[:split_idx], y[split_idx:]
-
-    # Create datasets
-    train_dataset = WeatherDataset(X_train, y_train)
-    val_dataset = WeatherDataset(X_val, y_val)
-
-    train_loader = DataLoader(train_dataset, batch_size=32, shuffle=True)
-    val_loader = DataLoader(val_dataset, batch_size=32, shuffle=False)
+    scaler, train_starts_path, val_starts_path = prepare_data(
+        data_path, features_path, args.chunksize, sequence_length, horizon
+    )
+    train_dataset = MemmapWeatherDataset(features_path, train_starts_path, sequence_length, horizon)
+    val_dataset = MemmapWeatherDataset(features_path, val_starts_path, sequence_length, horizon)
+
+    loader_options = {
+        "batch_size": args.batch_size,
+        "num_workers": args.num_workers,
+        "persistent_workers": args.num_workers > 0,
+    }
+    train_sampler = BlockShuffleSampler(
+        len(train_dataset), block_size=args.shuffle_block_size, buffer_blocks=args.shuffle_buffer_blocks
+    )
+    train_loader = DataLoader(train_dataset, sampler=train_sampler, **loader_options)
+    val_loader = DataLoader(val_dataset, shuffle=False, **loader_options)
 
     # Initialize model
     device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
-    print(f"Using device: {device}")
+    if args.threads:
+        torch.set_num_threads(args.threads)
+    print(f"Using device: {device} ({torch.get_num_threads()} threads)")
 
     model = WeatherLSTM(input_size=3, hidden_size=64, num_layers=2, output_size=21)
     model = model.to(device)
@@ -141,30 +510,50 @@ def main():
     criterion = nn.MSELoss()
     optimizer = torch.optim.Adam(model.parameters(), lr=0.001)
 
+    checkpoint_path = args.checkpoint or models_dir / "checkpoint.pt"
+    start_epoch, progress = 0, None
+    if args.resume:
+        checkpoint = load_checkpoint(checkpoint_path, model, optimizer, train_sampler)
+        start_epoch, progress = checkpoint["epoch"] + 1, checkpoint["progress"]
+        # Keep the scaler the checkpointed weights were trained against
+        scaler = checkpoint["scaler"]
+        print(f"Resuming from {checkpoint_path} at epoch {start_epoch + 1}")
+
+    def on_epoch_end(epoch, progress):
+        if args.checkpoint_every and (epoch + 1) % args.checkpoint_every == 0:
+            save_checkpoint(checkpoint_path, model, optimizer, epoch, progress, scaler, train_sampler)
+
     print("Training model...")
-    train_model(model, train_loader, criterion, optimizer, num_epochs=100, device=device)
+    training_start = time.perf_counter()
+    train_model(
+        model,
+        train_loader,
+        criterion,
+        optimizer,
+        num_epochs=args.epochs,
+        device=device,
+        val_loader=val_loader,
+        patience=args.patience or None,
+        log_every=1,
+        start_epoch=start_epoch,
+        progress=progress,
+        on_epoch_end=on_epoch_end,
+    )
+    print(f"Training took {time.perf_counter() - training_start:.1f}s")
 
     # Validation
-    model.eval()
-    val_loss = 0
-    with torch.no_grad():
-        for sequences, targets in val_loader:
-            sequences, targets = sequences.to(device), targets.to(device)
-            outputs = model(sequences)
-            loss = criterion(outputs, targets)
-            val_loss += loss.item()
-
-    avg_val_loss = val_loss / len(val_loader)
+    avg_val_loss = evaluate(model, val_loader, criterion, device)
     print(f"Validation Loss: {avg_val_loss:.6f}")
 
     # Save model and scaler
-    torch.save(model.state_dict(), model_path)
+    save_weights(model, model_path, numpy_weights_path)
     import pickle
 
     with open(scaler_path, "wb") as f:
         pickle.dump(scaler, f)
 
     print(f"Model saved to {model_path}")
+    print(f"NumPy weights saved to {numpy_weights_path}")
     print(f"Scaler saved to {scaler_path}")
     print("Training complete!")
 